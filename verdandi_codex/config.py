@@ -9,6 +9,12 @@ from pathlib import Path
 from typing import Optional, Dict, Any
 from dataclasses import dataclass, field, asdict
 
+# Prefer libyaml's C loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader, CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeLoader as YamlLoader, SafeDumper as YamlDumper
+
 
 @dataclass
 class DatabaseConfig:
@@ -107,7 +113,7 @@ class VerdandiConfig:
         
         if config_file.exists():
             with open(config_file, "r") as f:
-                data = yaml.safe_load(f) or {}
+                data = yaml.load(f, Loader=YamlLoader) or {}
             
             return cls(
                 node=NodeIdentityConfig(**data.get("node", {})),
@@ -134,7 +140,7 @@ class VerdandiConfig:
         }
         
         with open(config_file, "w") as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(data, f, Dumper=YamlDumper, default_flow_style=False, sort_keys=False)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert configuration to dictionary."""
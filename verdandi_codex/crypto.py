@@ -2,6 +2,7 @@
 Certificate management and cryptographic utilities for mTLS.
 """
 
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Optional, Tuple
@@ -249,14 +250,27 @@ class NodeCertificateManager:
     
     def get_certificate_fingerprint(self) -> Optional[str]:
         """Get SHA256 fingerprint of node certificate."""
-        if not self.node_cert_path.exists():
+        try:
+            mtime_ns = self.node_cert_path.stat().st_mtime_ns
+        except FileNotFoundError:
             return None
         
-        with open(self.node_cert_path, "rb") as f:
-            cert = x509.load_pem_x509_certificate(f.read(), default_backend())
-        
-        fingerprint = cert.fingerprint(hashes.SHA256())
-        return fingerprint.hex()
+        return _certificate_fingerprint(str(self.node_cert_path), mtime_ns)
+
+
+@lru_cache(maxsize=8)
+def _certificate_fingerprint(cert_path: str, mtime_ns: int) -> str:
+    """Parse a PEM certificate and return its SHA256 fingerprint.
+    
+    Keyed on the file's mtime so a reissued certificate is picked up,
+    while repeat lookups (e.g. every GetNodeInfo call) skip the read and
+    x509 parse.
+    """
+    with open(cert_path, "rb") as f:
+        cert = x509.load_pem_x509_certificate(f.read(), default_backend())
+    
+    fingerprint = cert.fingerprint(hashes.SHA256())
+    return fingerprint.hex()
 
 
 # Add missing import
@@ -2,6 +2,7 @@
 Database configuration and session management.
 """
 
+from contextlib import contextmanager
 from sqlalchemy import create_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
 from typing import Optional
@@ -50,13 +51,18 @@ class DatabaseConfig:
 class Database:
     """Database connection manager."""
     
-    def __init__(self, config: Optional[DatabaseConfig] = None):
+    def __init__(
+        self,
+        config: Optional[DatabaseConfig] = None,
+        pool_size: int = 10,
+        max_overflow: int = 20,
+    ):
         self.config = config or DatabaseConfig()
         self.engine = create_engine(
             self.config.connection_string,
             pool_pre_ping=True,  # Verify connections before using
-            pool_size=10,
-            max_overflow=20,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
         )
         self.SessionLocal = sessionmaker(
             autocommit=False,
@@ -75,3 +81,16 @@ class Database:
     def get_session(self):
         """Get a new database session."""
         return self.SessionLocal()
+    
+    @contextmanager
+    def session_scope(self):
+        """Provide a session that commits on success and rolls back on error."""
+        session = self.SessionLocal()
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
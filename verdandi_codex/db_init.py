@@ -34,6 +34,15 @@ def init_database(drop_existing: bool = False):
         return False
 
 
+def confirm_drop() -> bool:
+    """Ask the user to confirm dropping all tables."""
+    confirm = input("⚠️  This will DROP ALL TABLES. Are you sure? (yes/no): ")
+    if confirm.lower() != "yes":
+        print("Aborted.")
+        return False
+    return True
+
+
 def main():
     """Command-line entry point for database initialization."""
     import argparse
@@ -47,11 +56,8 @@ def main():
     
     args = parser.parse_args()
     
-    if args.drop:
-        confirm = input("⚠️  This will DROP ALL TABLES. Are you sure? (yes/no): ")
-        if confirm.lower() != "yes":
-            print("Aborted.")
-            return
+    if args.drop and not confirm_drop():
+        return
     
     success = init_database(drop_existing=args.drop)
     sys.exit(0 if success else 1)
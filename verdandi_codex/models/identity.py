@@ -17,7 +17,7 @@ class Node(Base):
     __tablename__ = "nodes"
     
     node_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    hostname = Column(String(255), nullable=False)
+    hostname = Column(String(255), nullable=False, index=True)
     display_name = Column(String(255), nullable=True)
     ip_last_seen = Column(String(45), nullable=True)  # IPv4 or IPv6
     daemon_port = Column(Integer, default=50051)
@@ -25,7 +25,7 @@ class Node(Base):
     tags = Column(JSON, default=list)  # List of tags like ["kitchen", "gpu"]
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     last_seen_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    status = Column(String(50), default="offline")  # online, offline, degraded
+    status = Column(String(50), default="offline", index=True)  # online, offline, degraded
     
     # Relationships
     capabilities = relationship("NodeCapability", back_populates="node", uselist=False)
@@ -45,10 +45,11 @@ class JackServicer(verdandi_pb2_grpc.JackServiceServicer):
             # Get all ports
             all_ports = client.get_ports()
             logger.info(f"GetJackGraph: Found {len(all_ports)} total ports")
-            output_ports = set(p.name for p in client.get_ports() if p.is_output)
             
-            # Group ports by client name
-            clients_dict = {}
+            # Build the response in place: repeated fields are filled with
+            # add() rather than assembled as dicts and copied in afterwards
+            response = verdandi_pb2.JackGraphResponse()
+            clients_by_name = {}
             for port_obj in all_ports:
                 port_name = port_obj.name
                 
@@ -57,60 +58,29 @@ class JackServicer(verdandi_pb2_grpc.JackServiceServicer):
                     continue
                     
                 client_name, port_short = port_name.split(':', 1)
-                if client_name not in clients_dict:
-                    clients_dict[client_name] = {
-                        'name': client_name,
-                        'input_ports': [],
-                        'output_ports': []
-                    }
+                jack_client = clients_by_name.get(client_name)
+                if jack_client is None:
+                    jack_client = clients_by_name[client_name] = response.clients.add(name=client_name)
                     logger.info(f"GetJackGraph: Found client '{client_name}'")
                 
-                # Check if port is output and if it's MIDI
-                is_output = port_name in output_ports
-                is_midi = port_obj.is_midi
-                
-                port_info = verdandi_pb2.JackPort(
-                    name=port_short,
-                    full_name=port_name,
-                    is_midi=is_midi
-                )
-                
-                if is_output:
-                    clients_dict[client_name]['output_ports'].append(port_info)
-                else:
-                    clients_dict[client_name]['input_ports'].append(port_info)
-            
-            # Build client list
-            clients = []
-            for client_data in clients_dict.values():
-                clients.append(verdandi_pb2.JackClient(
-                    name=client_data['name'],
-                    input_ports=client_data['input_ports'],
-                    output_ports=client_data['output_ports']
-                ))
+                ports = jack_client.output_ports if port_obj.is_output else jack_client.input_ports
+                ports.add(name=port_short, full_name=port_name, is_midi=port_obj.is_midi)
             
             # Get all connections
-            connections = []
             for port_obj in all_ports:
                 if port_obj.is_output:
                     # Get connections from this output port
-                    connected_ports = client.get_all_connections(port_obj)
-                    for connected_port in connected_ports:
-                        connections.append(verdandi_pb2.JackConnection(
+                    for connected_port in client.get_all_connections(port_obj):
+                        response.connections.add(
                             output_port=port_obj.name,
                             input_port=connected_port.name
-                        ))
+                        )
             
             # Get JACK settings
-            sample_rate = client.samplerate
-            buffer_size = client.blocksize
+            response.sample_rate = client.samplerate
+            response.buffer_size = client.blocksize
             
-            return verdandi_pb2.JackGraphResponse(
-                clients=clients,
-                connections=connections,
-                sample_rate=sample_rate,
-                buffer_size=buffer_size
-            )
+            return response
             
         except Exception as e:
             logger.error(f"Failed to get JACK graph: {e}", exc_info=True)
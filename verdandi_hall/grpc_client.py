@@ -4,7 +4,7 @@ Helper utilities for making gRPC calls to remote Verdandi nodes.
 
 import logging
 import grpc
-from typing import Optional
+from typing import Dict, Optional
 
 from verdandi_codex.proto import verdandi_pb2, verdandi_pb2_grpc
 from verdandi_codex.database import Database
@@ -12,30 +12,40 @@ from verdandi_codex.models.identity import Node
 
 logger = logging.getLogger(__name__)
 
+# Long-lived channels shared by GUI actions: address -> channel
+_shared_channels: Dict[str, grpc.Channel] = {}
+
+
+def _create_channel(address: str) -> grpc.Channel:
+    """Open an insecure channel to a node's daemon."""
+    return grpc.insecure_channel(
+        address,
+        options=[
+            ("grpc.max_send_message_length", 50 * 1024 * 1024),
+            ("grpc.max_receive_message_length", 50 * 1024 * 1024),
+        ]
+    )
+
 
 class VerdandiGrpcClient:
     """Client for making gRPC calls to remote Verdandi nodes."""
     
-    def __init__(self, node: Node, timeout: int = 10):
+    def __init__(self, node: Node, timeout: int = 10, channel: Optional[grpc.Channel] = None):
         """
         Initialize client for a specific node.
         
         Args:
             node: Node model with connection info
             timeout: Request timeout in seconds
+            channel: Existing channel to reuse; it is not closed by close()
         """
         self.node = node
         self.timeout = timeout
         self.address = f"{node.ip_last_seen}:{node.daemon_port}"
+        self._owns_channel = channel is None
         
         # Create channel (insecure for now, TODO: add TLS)
-        self.channel = grpc.insecure_channel(
-            self.address,
-            options=[
-                ("grpc.max_send_message_length", 50 * 1024 * 1024),
-                ("grpc.max_receive_message_length", 50 * 1024 * 1024),
-            ]
-        )
+        self.channel = channel or _create_channel(self.address)
         
         # Create stubs
         self.identity_stub = verdandi_pb2_grpc.NodeIdentityServiceStub(self.channel)
@@ -43,8 +53,8 @@ class VerdandiGrpcClient:
         self.jacktrip_stub = verdandi_pb2_grpc.JackTripServiceStub(self.channel)
     
     def close(self):
-        """Close the gRPC channel."""
-        if self.channel:
+        """Close the gRPC channel unless it is shared."""
+        if self.channel and self._owns_channel:
             self.channel.close()
     
     def get_jack_graph(self):
@@ -198,3 +208,30 @@ def get_grpc_client(node_id: str, database: Database) -> Optional[VerdandiGrpcCl
     except Exception as e:
         logger.error(f"Failed to create gRPC client: {e}", exc_info=True)
         return None
+
+
+def get_shared_client(node: Node, timeout: int = 10) -> VerdandiGrpcClient:
+    """
+    Get a gRPC client for a node that reuses one long-lived channel per address.
+    
+    The channel stays open across actions, so repeated calls skip
+    connection setup whatever timeout they use. The returned client is
+    cheap and carries the caller's node and timeout; closing it leaves the
+    shared channel open.
+    
+    Args:
+        node: Node model with connection info
+        timeout: Request timeout in seconds
+    """
+    address = f"{node.ip_last_seen}:{node.daemon_port}"
+    channel = _shared_channels.get(address)
+    if channel is None:
+        channel = _shared_channels[address] = _create_channel(address)
+    return VerdandiGrpcClient(node, timeout=timeout, channel=channel)
+
+
+def close_shared_clients():
+    """Close all channels handed out through get_shared_client."""
+    for channel in _shared_channels.values():
+        channel.close()
+    _shared_channels.clear()
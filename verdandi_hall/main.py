@@ -13,6 +13,7 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Qt, QTimer, QSettings
 from PySide6.QtGui import QIcon, QAction
+from sqlalchemy.orm import load_only
 
 from verdandi_codex.config import VerdandiConfig
 from verdandi_codex.database import Database
@@ -211,6 +212,7 @@ class VerdandiHall(QMainWindow):
         # Create list widget
         self.node_list = QListWidget()
         self.node_list.itemClicked.connect(self._on_node_clicked)  # Single click, not double
+        self._node_list_rows = None  # (text, node_id) rows currently shown
         dock.setWidget(self.node_list)
         
         # Add dock to left side
@@ -231,14 +233,12 @@ class VerdandiHall(QMainWindow):
             
         try:
             session = self.db.get_session()
-            nodes = session.query(Node).order_by(Node.hostname).all()
+            nodes = session.query(Node.node_id, Node.hostname, Node.status).order_by(Node.hostname).all()
             session.close()
             
-            # Clear and repopulate list
-            self.node_list.clear()
-            
             logger.info(f"Local node_id: {self.config.node.node_id}")
             
+            rows = []
             for node in nodes:
                 # Convert both to strings for comparison to handle UUID vs string
                 is_local = str(node.node_id) == str(self.config.node.node_id)
@@ -251,12 +251,24 @@ class VerdandiHall(QMainWindow):
                     continue
                 
                 status_icon = "🟢" if node.status == "online" else "🔴"
-                
-                item_text = f"{status_icon} {node.hostname}"
-                item = QListWidgetItem(item_text)
-                item.setData(Qt.UserRole, str(node.node_id))  # Store node_id as data
-                
-                self.node_list.addItem(item)
+                rows.append((f"{status_icon} {node.hostname}", str(node.node_id)))
+            
+            # Nothing changed since the last poll - keep the list (and selection) as is
+            if rows == self._node_list_rows:
+                return
+            self._node_list_rows = rows
+            
+            # Clear and repopulate list with repaints suspended, so the view
+            # updates once rather than per row
+            self.node_list.setUpdatesEnabled(False)
+            try:
+                self.node_list.clear()
+                for item_text, node_id in rows:
+                    item = QListWidgetItem(item_text)
+                    item.setData(Qt.UserRole, node_id)  # Store node_id as data
+                    self.node_list.addItem(item)
+            finally:
+                self.node_list.setUpdatesEnabled(True)
                 
         except Exception as e:
             logger.error("node_list_refresh_failed", error=str(e))
@@ -367,13 +379,12 @@ class VerdandiHall(QMainWindow):
             # Query remote JACK graph via gRPC and create canvas
             from PySide6.QtWidgets import QLabel
             from PySide6.QtCore import Qt
-            from verdandi_hall.grpc_client import VerdandiGrpcClient
+            from verdandi_hall.grpc_client import get_shared_client
             
             try:
                 # Query remote JACK graph
                 logger.info(f"Querying JACK graph from {node.hostname} ({node.ip_last_seen})")
-                with VerdandiGrpcClient(node) as client:
-                    jack_graph = client.get_jack_graph()
+                jack_graph = get_shared_client(node).get_jack_graph()
                 
                 logger.info(f"Received JACK graph with {len(jack_graph.clients)} clients from {node.hostname}")
                 logger.info(f"Client names in response: {[c.name for c in jack_graph.clients]}")
@@ -508,6 +519,25 @@ class VerdandiHall(QMainWindow):
         except Exception as e:
             logger.error(f"Failed to get hub info: {e}")
         
+        # Resolve every JackTrip client IP to a hostname in one query
+        import re
+        ip_pattern = re.compile(r'__ffff_(\d+\.\d+\.\d+\.\d+)')
+        jacktrip_ips = {}
+        for client in jack_graph.clients:
+            match = ip_pattern.match(client.name)
+            if match:
+                jacktrip_ips[client.name] = match.group(1)
+        hostnames_by_ip = {}
+        if jacktrip_ips:
+            try:
+                hostnames_by_ip = dict(
+                    session.query(Node.ip_last_seen, Node.hostname)
+                    .filter(Node.ip_last_seen.in_(set(jacktrip_ips.values())))
+                    .all()
+                )
+            except Exception as e:
+                logger.error(f"Failed to resolve JackTrip client hostnames: {e}")
+        
         # Add clients and ports
         x, y = 50, 50  # Starting position for auto-layout (fallback)
         for client in jack_graph.clients:
@@ -515,19 +545,13 @@ class VerdandiHall(QMainWindow):
             hostname_alias = None  # Track if we need to set an alias
             
             # Check if this is a JackTrip client - map to hostname for display
-            import re
-            ip_pattern = re.compile(r'__ffff_(\d+\.\d+\.\d+\.\d+)')
-            if ip_pattern.match(client_name):
+            ip_address = jacktrip_ips.get(client_name)
+            if ip_address:
                 # This is a JackTrip client connection
                 # Map to hostname for display, but keep original name for node
-                ip_address = ip_pattern.match(client_name).group(1)
-                try:
-                    node = session.query(Node).filter_by(ip_last_seen=ip_address).first()
-                    if node:
-                        hostname_alias = node.hostname
-                        logger.info(f"Will map JackTrip client {ip_address} to display as {hostname_alias}")
-                except:
-                    pass
+                hostname_alias = hostnames_by_ip.get(ip_address)
+                if hostname_alias:
+                    logger.info(f"Will map JackTrip client {ip_address} to display as {hostname_alias}")
             
             # Split system and a2j clients into capture/playback nodes
             if client_name == "system":
@@ -691,34 +715,40 @@ class VerdandiHall(QMainWindow):
         
         # Query the daemon for actual JackTrip status
         try:
-            from verdandi_hall.grpc_client import VerdandiGrpcClient
+            from verdandi_hall.grpc_client import get_shared_client
             session = self.db.get_session()
-            node = session.query(Node).filter_by(node_id=self.current_remote_node_id).first()
+            # Only the columns the gRPC client needs; the node is used detached
+            node = (
+                session.query(Node)
+                .options(load_only(Node.hostname, Node.ip_last_seen, Node.daemon_port))
+                .filter_by(node_id=self.current_remote_node_id)
+                .first()
+            )
             session.close()
             
             if not node:
                 logger.warning(f"Node {self.current_remote_node_id} not found")
                 return
             
-            with VerdandiGrpcClient(node) as client:
-                status = client.get_jacktrip_status()
-                
-                logger.info(f"JackTrip status from {node.hostname}: hub_running={status.hub_running}, client_running={status.client_running}")
-                
-                # Extract client names for hostname mapping
-                client_names = [c.name for c in jack_graph.clients]
-                
-                # Update remote canvas state based on daemon response
-                if hasattr(self.remote_jack_canvas, '_on_jacktrip_state_detected'):
-                    self.remote_jack_canvas._on_jacktrip_state_detected(
-                        status.hub_running,
-                        status.client_running,
-                        client_names
-                    )
-                    logger.info(f"Updated remote canvas state: hub={status.hub_running}, client={status.client_running}")
-                else:
-                    logger.warning("remote_jack_canvas doesn't have _on_jacktrip_state_detected method")
-                        
+            client = get_shared_client(node)
+            status = client.get_jacktrip_status()
+            
+            logger.info(f"JackTrip status from {node.hostname}: hub_running={status.hub_running}, client_running={status.client_running}")
+            
+            # Extract client names for hostname mapping
+            client_names = [c.name for c in jack_graph.clients]
+            
+            # Update remote canvas state based on daemon response
+            if hasattr(self.remote_jack_canvas, '_on_jacktrip_state_detected'):
+                self.remote_jack_canvas._on_jacktrip_state_detected(
+                    status.hub_running,
+                    status.client_running,
+                    client_names
+                )
+                logger.info(f"Updated remote canvas state: hub={status.hub_running}, client={status.client_running}")
+            else:
+                logger.warning("remote_jack_canvas doesn't have _on_jacktrip_state_detected method")
+                    
         except Exception as e:
             logger.error(f"Failed to query JackTrip status: {e}", exc_info=True)
     
@@ -737,8 +767,10 @@ class VerdandiHall(QMainWindow):
         pass
     
     def closeEvent(self, event):
-        """Save window geometry before closing."""
+        """Save window geometry and close shared gRPC channels before closing."""
+        from verdandi_hall.grpc_client import close_shared_clients
         self.settings.setValue("geometry", self.saveGeometry())
+        close_shared_clients()
         event.accept()
     
     def _create_menu_bar(self):
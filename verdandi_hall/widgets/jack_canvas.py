@@ -5,19 +5,46 @@ Adapted from skeleton-crew node_canvas_v3.py with Verdandi integration.
 
 from __future__ import annotations
 
+import functools
+import ipaddress
 import json
 import logging
+import math
+import mmap
+import os
+import re
+import socket
+import subprocess
+import sys
+import threading
+import time
 from typing import Optional, Dict, List, Set, Tuple, TYPE_CHECKING
 from pathlib import Path
+from collections import defaultdict
 from dataclasses import dataclass, field
 
+try:
+    import orjson  # Optional: much faster preset (de)serialization
+except ImportError:
+    orjson = None
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGraphicsView, QGraphicsScene,
-    QGraphicsItem, QPushButton, QComboBox, QLabel,
-    QInputDialog, QMessageBox
+    QGraphicsItem, QGraphicsLineItem, QPushButton, QComboBox, QLabel,
+    QInputDialog, QMessageBox, QMenu, QDialog, QDialogButtonBox, QFormLayout, QSpinBox
 )
-from PySide6.QtCore import Qt, QPointF, QRectF, QTimer, Signal, QObject
-from PySide6.QtGui import QPainter, QPainterPath, QPen, QColor, QBrush, QFont
+from PySide6.QtCore import (
+    Qt, QLineF, QPointF, QRectF, QTimer, Signal, QObject, QRunnable, QThreadPool
+)
+from PySide6.QtGui import (
+    QPainter, QPainterPath, QPen, QColor, QBrush, QFont, QFontMetrics, QKeySequence,
+    QShortcut, QStaticText, QTransform
+)
+
+from verdandi_codex.config import VerdandiConfig
+from verdandi_codex.database import Database
+from verdandi_codex.models.identity import Node
+from verdandi_codex.models.jacktrip import JackTripHub, JackTripClient
+from verdandi_hall.grpc_client import get_shared_client
 
 if TYPE_CHECKING:
     from .jack_client_manager import JackClientManager
@@ -31,6 +58,189 @@ logger = logging.getLogger(__name__)
 # Audio connections: Orange
 # MIDI connections: Purple
 
+# Shared paint resources - built once instead of on every paint
+_NODE_BRUSH_AUDIO = QBrush(QColor(50, 60, 80))    # Audio-only node: blue-gray
+_NODE_BRUSH_MIDI = QBrush(QColor(80, 50, 50))     # MIDI-only node: red-gray
+_NODE_BRUSH_MIXED = QBrush(QColor(70, 60, 80))    # Mixed node: purple-gray
+_NODE_BRUSH_EMPTY = QBrush(QColor(50, 50, 50))    # Default gray for nodes with no ports
+_NODE_BORDER_PEN = QPen(QColor(200, 200, 200), 2)
+_TITLE_PEN = QPen(QColor(255, 255, 255))
+_LABEL_PEN = QPen(QColor(200, 200, 200))
+
+_AUDIO_IN_BRUSH = QBrush(QColor(100, 100, 255))   # Blue for audio inputs
+_MIDI_IN_BRUSH = QBrush(QColor(200, 100, 255))    # Purple for MIDI inputs
+_AUDIO_OUT_BRUSH = QBrush(QColor(100, 255, 100))  # Green for audio outputs
+_MIDI_OUT_BRUSH = QBrush(QColor(255, 200, 100))   # Orange for MIDI outputs
+
+_AUDIO_CONN_PEN = QPen(QColor(255, 200, 100), 2)        # Orange for audio
+_AUDIO_CONN_HOVER_PEN = QPen(QColor(255, 100, 100), 4)  # Red when hovered
+_MIDI_CONN_PEN = QPen(QColor(200, 100, 255), 2)         # Purple for MIDI
+_MIDI_CONN_HOVER_PEN = QPen(QColor(255, 100, 255), 4)   # Bright magenta when hovered
+
+
+# ============================================================================
+# JACKTRIP CLIENT NAMES
+# ============================================================================
+
+# JackTrip names peer clients after their IPv4-mapped address, e.g. "__ffff_192.168.32.9"
+_JACKTRIP_IP_CLIENT_PREFIX = "__ffff_"
+_JACKTRIP_IP_CLIENT_RE = re.compile(r'__ffff_(\d+\.\d+\.\d+\.\d+)')
+
+@functools.lru_cache(maxsize=256)
+def _jacktrip_client_ip(client_name: str) -> Optional[str]:
+    """Return the IP address in a JackTrip peer client name, or None if it isn't one."""
+    if not client_name.startswith(_JACKTRIP_IP_CLIENT_PREFIX):
+        return None
+    match = _JACKTRIP_IP_CLIENT_RE.match(client_name)
+    if not match:
+        return None
+    try:
+        return str(ipaddress.ip_address(match.group(1)))
+    except ValueError:
+        return None  # e.g. an out-of-range octet
+
+# Node hostname lookups by IP, reused for a while instead of querying the
+# database on every refresh: ip -> (expires_at, hostname or None)
+_HOSTNAME_TTL = 300.0
+_hostname_by_ip: Dict[str, Tuple[float, Optional[str]]] = {}
+
+def _hostname_for_ip(ip_address: str) -> Optional[str]:
+    """Hostname of the Node last seen at ip_address, cached for _HOSTNAME_TTL seconds."""
+    now = time.monotonic()
+    cached = _hostname_by_ip.get(ip_address)
+    if cached and cached[0] > now:
+        return cached[1]
+    db = Database()
+    with db.get_session() as session:
+        row = session.query(Node.hostname).filter_by(ip_last_seen=ip_address).first()
+    hostname = row[0] if row else None
+    _hostname_by_ip[ip_address] = (now + _HOSTNAME_TTL, hostname)
+    return hostname
+
+@functools.lru_cache(maxsize=1)
+def _local_hostname() -> str:
+    """Short hostname of this machine (fixed for the life of the process)."""
+    return socket.gethostname().split('.')[0]
+
+
+# ============================================================================
+# SHARED TEXT MEASUREMENT
+# ============================================================================
+
+@functools.lru_cache(maxsize=1)
+def _fonts() -> Tuple[QFont, QFont, QFontMetrics, QFontMetrics]:
+    """Title/port fonts and their metrics, built once (needs a QGuiApplication)."""
+    title_font = QFont("Sans", 9, QFont.Bold)
+    port_font = QFont("Sans", 8)
+    return title_font, port_font, QFontMetrics(title_font), QFontMetrics(port_font)
+
+@functools.lru_cache(maxsize=4096)
+def _title_width(text: str) -> int:
+    return _fonts()[2].horizontalAdvance(text)
+
+@functools.lru_cache(maxsize=4096)
+def _port_width(text: str) -> int:
+    return _fonts()[3].horizontalAdvance(text)
+
+def _static_text(text: str, font: QFont) -> QStaticText:
+    """Build a QStaticText with its glyph layout prepared for font."""
+    st = QStaticText(text)
+    st.setPerformanceHint(QStaticText.AggressiveCaching)
+    st.prepare(QTransform(), font)
+    return st
+
+
+# ============================================================================
+# PRESET FILE I/O
+# ============================================================================
+
+# With orjson, presets larger than this are parsed straight from a memory
+# map rather than read into a buffer
+_MMAP_THRESHOLD = 64 * 1024
+
+if orjson is not None:
+    _loads = orjson.loads
+
+    def _dumps(data) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+else:
+    _loads = json.loads
+
+    def _dumps(data) -> bytes:
+        return json.dumps(data, indent=2).encode()
+
+def _read_json(path: Path):
+    """Parse a JSON file in one read (memory-mapped for large presets with orjson)."""
+    with open(path, "rb") as f:
+        # The stdlib parser needs a bytes copy anyway, so mapping only pays off
+        # when orjson can parse straight from the mapping
+        if orjson is None or os.fstat(f.fileno()).st_size <= _MMAP_THRESHOLD:
+            return _loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+
+def _write_json_atomic(path: Path, data):
+    """Write data as indented JSON via a temp file + rename, so readers never see a partial file."""
+    tmp = path.with_suffix(".json.tmp")
+    tmp.write_bytes(_dumps(data))
+    os.replace(tmp, path)
+
+
+class _LastPresetStore:
+    """Process-wide node_id -> last preset name map, shared by all canvases.
+    
+    Every canvas records into the same jack_last_presets.json, so the parsed
+    map and its mtime live here once, and writes are serialized by a lock so
+    concurrent saves from different canvases cannot clobber each other.
+    """
+    
+    _instance: Optional[_LastPresetStore] = None
+    _instance_lock = threading.Lock()
+    
+    def __init__(self, path: Path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._map: dict = {}
+        self._mtime_ns: Optional[int] = None
+    
+    @classmethod
+    def instance(cls) -> _LastPresetStore:
+        with cls._instance_lock:
+            if cls._instance is None:
+                path = Path.home() / ".config" / "verdandi" / "jack_last_presets.json"
+                path.parent.mkdir(parents=True, exist_ok=True)
+                cls._instance = cls(path)
+            return cls._instance
+    
+    def _reload_if_stale(self):
+        """Re-parse the file only when its mtime changed (caller holds the lock)."""
+        try:
+            mtime = self.path.stat().st_mtime_ns
+        except FileNotFoundError:
+            self._map, self._mtime_ns = {}, None
+            return
+        if mtime != self._mtime_ns:
+            self._map = _read_json(self.path)
+            self._mtime_ns = mtime
+    
+    def get(self, node_id: str) -> Optional[str]:
+        with self._lock:
+            self._reload_if_stale()
+            return self._map.get(node_id)
+    
+    def set(self, node_id: str, preset_name: str):
+        with self._lock:
+            self._reload_if_stale()
+            if self._map.get(node_id) == preset_name:
+                return  # Already recorded
+            updated = dict(self._map)
+            updated[node_id] = preset_name
+            _write_json_atomic(self.path, updated)
+            # Our own write is current; don't re-read it on the next lookup
+            self._map = updated
+            self._mtime_ns = self.path.stat().st_mtime_ns
+
 
 # ============================================================================
 # PURE DATA MODEL (No Qt, No UI)
@@ -64,6 +274,8 @@ class GraphModel(QObject):
     """Pure data model of the JACK graph. No rendering logic."""
     
     changed = Signal()  # Emitted when model changes
+    aliasChanged = Signal(str)  # Emitted with the original name when its alias changes
+    nodeMoved = Signal(str, float, float)  # Emitted with a node's final position after a move
     
     def __init__(self):
         super().__init__()
@@ -85,7 +297,10 @@ class GraphModel(QObject):
             self.aliases[original_name] = alias
         elif original_name in self.aliases:
             del self.aliases[original_name]
-        self.changed.emit()
+        else:
+            return
+        # Only the node's title changes - no need for a full view sync
+        self.aliasChanged.emit(original_name)
     
     def get_display_name(self, original_name: str) -> str:
         """Get display name (alias if set, otherwise original)."""
@@ -126,6 +341,7 @@ class GraphModel(QObject):
         if name in self.nodes:
             self.nodes[name].x = x
             self.nodes[name].y = y
+            self.nodeMoved.emit(name, x, y)
             self.changed.emit()
     
     def add_connection(self, output_port: str, input_port: str):
@@ -160,6 +376,9 @@ class GraphModel(QObject):
 class NodeGraphicsItem(QGraphicsItem):
     """Visual representation of a NodeModel. Pure rendering, no data."""
     
+    socket_radius = 5
+    _port_pick_radius_sq = (socket_radius * 2) ** 2  # Click area slightly larger than socket
+    
     def __init__(self, model: NodeModel, graph_model: GraphModel):
         super().__init__()
         self.model = model
@@ -167,136 +386,209 @@ class NodeGraphicsItem(QGraphicsItem):
         self._dragging_connection = False
         self._drag_start_port = None
         self._drag_is_output = False
+        self._drag_view = None  # GraphCanvas receiving the current connection drag
+        self._press_positions = {}  # Node item -> pos() when the mouse went down
         
         # CRITICAL: Use exact flags from working test
         self.setFlags(
             QGraphicsItem.ItemIsMovable |
             QGraphicsItem.ItemIsSelectable |
-            QGraphicsItem.ItemSendsScenePositionChanges
+            QGraphicsItem.ItemSendsScenePositionChanges |
+            QGraphicsItem.ItemUsesExtendedStyleOption  # Populate option.exposedRect
         )
         
-        # Disable caching to prevent artifacts during drag
-        self.setCacheMode(QGraphicsItem.NoCache)
+        # Node content is static until the model changes, so cache the rendered
+        # node and just blit it on pan/zoom/move. Anything that changes content
+        # (rename, port changes) must call update() to invalidate the cache.
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
         
         self.setPos(model.x, model.y)
-        self.socket_radius = 5
         self.setAcceptHoverEvents(True)
         self._calculate_size()
     
     def _calculate_size(self):
         """Calculate node size based on content."""
-        from PySide6.QtGui import QFontMetrics
-        
-        # Measure text widths
-        font_title = QFont("Sans", 9, QFont.Bold)
-        font_port = QFont("Sans", 8)
-        metrics_title = QFontMetrics(font_title)
-        metrics_port = QFontMetrics(font_port)
-        
         # Calculate minimum width based on title
-        title_width = metrics_title.horizontalAdvance(self.model.name) + 20  # padding
+        title_width = _title_width(self.model.name) + 20  # padding
         
         # If node has both inputs and outputs, need space for both side-by-side
         if self.model.inputs and self.model.outputs:
             # Find longest input and output names
-            max_input_width = 0
-            for port in self.model.inputs:
-                width = metrics_port.horizontalAdvance(port.name)
-                max_input_width = max(max_input_width, width)
-            
-            max_output_width = 0
-            for port in self.model.outputs:
-                width = metrics_port.horizontalAdvance(port.name)
-                max_output_width = max(max_output_width, width)
+            max_input_width = max((_port_width(p.name) for p in self.model.inputs), default=0)
+            max_output_width = max((_port_width(p.name) for p in self.model.outputs), default=0)
             
             # Total width = left port text + spacing + right port text + margins
             port_width = max_input_width + max_output_width + 60  # 60 for sockets, padding, gap
         else:
             # Only inputs or only outputs - calculate normally
-            max_port_width = 100
-            for port in self.model.inputs + self.model.outputs:
-                port_width_calc = metrics_port.horizontalAdvance(port.name) + 24
-                max_port_width = max(max_port_width, port_width_calc)
-            port_width = max_port_width
+            port_width = max(
+                (_port_width(p.name) + 24 for p in self.model.inputs + self.model.outputs),
+                default=0,
+            )
+            port_width = max(100, port_width)
         
         # Width is the maximum of title and port requirements
         self.width = max(150, title_width, port_width)
-    
-    def _calculate_height(self):
-        """Calculate node height based on port count."""
-        max_ports = max(len(self.model.inputs), len(self.model.outputs), 1)
-        return max(100, 30 + max_ports * 18 + 10)
-    
-    def boundingRect(self):
+        self._cached_height = self._calculate_height()
+        self._content_key = self._compute_content_key()
+        
         # Expand bounds generously to include sockets AND any anti-aliasing
-        height = self._calculate_height()
         margin = 10  # Extra margin to prevent artifacts
-        return QRectF(-margin, -margin, 
-                      self.width + 2 * self.socket_radius + 2 * margin, 
-                      height + 2 * margin)
+        self._bounding_rect = QRectF(-margin, -margin,
+                                     self.width + 2 * self.socket_radius + 2 * margin,
+                                     self._cached_height + 2 * margin)
+        self._build_port_offsets()
+        self._build_static_text()
+        self._build_paint_groups()
+    
+    def _build_port_offsets(self):
+        """Precompute socket centers (item coords) for lookups and hit-testing."""
+        margin = 10
+        in_x = margin + self.socket_radius
+        out_x = margin + self.socket_radius + self.width
+        
+        # (port name, is_output) -> socket center
+        self._port_offsets: Dict[Tuple[str, bool], QPointF] = {}
+        # (x, y, port, is_output) in hit-test order: inputs first, then outputs
+        self._port_centers: List[Tuple[float, float, PortModel, bool]] = []
+        for ports, x, is_output in ((self.model.inputs, in_x, False),
+                                    (self.model.outputs, out_x, True)):
+            y = margin + 30
+            for port in ports:
+                self._port_offsets.setdefault((port.name, is_output), QPointF(x, y))
+                self._port_centers.append((x, y, port, is_output))
+                y += 18
+    
+    def _invalidate_geometry(self):
+        """Recompute cached size/text after the node's ports or name changed."""
+        self.prepareGeometryChange()
+        self._calculate_size()
+        self.update()
     
-    def paint(self, painter, option, widget):
-        # Get current height from boundingRect
-        height = self._calculate_height()
-        
-        # Background (offset to center within margin)
-        # Three-way color scheme based on port types
+    def refresh_display_name(self):
+        """Re-read the (possibly aliased) display name and redraw the title."""
+        display_name = self.graph_model.get_display_name(self.model.name)
+        if display_name == self._display_name:
+            return
+        self._display_name = display_name
+        self._title_static = _static_text(display_name, _fonts()[0])
+        self._content_key = self._compute_content_key()
+        self.update()
+    
+    def _compute_content_key(self) -> tuple:
+        """Everything that affects this node's geometry or rendering, except position."""
+        return (
+            self.graph_model.get_display_name(self.model.name),
+            tuple((p.full_name, p.is_midi) for p in self.model.inputs),
+            tuple((p.full_name, p.is_midi) for p in self.model.outputs),
+        )
+    
+    def set_model(self, model: NodeModel):
+        """Point this item at a (possibly new) NodeModel, redrawing only if its content changed."""
+        self.model = model
+        if self._compute_content_key() != self._content_key:
+            self._invalidate_geometry()
+        if self.pos() != QPointF(model.x, model.y):
+            self.setPos(model.x, model.y)
+    
+    def _build_static_text(self):
+        """Pre-lay-out the title and port labels so paint skips text shaping."""
+        title_font, port_font, _, _ = _fonts()
         margin = 10
-        all_ports = self.model.inputs + self.model.outputs
-        
-        if len(all_ports) > 0:
-            has_audio = any(not p.is_midi for p in all_ports)
-            has_midi = any(p.is_midi for p in all_ports)
-            
-            if has_audio and has_midi:
-                # Mixed node: purple-gray
-                painter.setBrush(QColor(70, 60, 80))
-            elif has_midi:
-                # MIDI-only node: red-gray
-                painter.setBrush(QColor(80, 50, 50))
-            else:
-                # Audio-only node: blue-gray
-                painter.setBrush(QColor(50, 60, 80))
-        else:
-            painter.setBrush(QColor(50, 50, 50))  # Default gray for nodes with no ports
-        
-        painter.setPen(QPen(QColor(200, 200, 200), 2))
-        painter.drawRoundedRect(margin + self.socket_radius, margin, self.width, height, 5, 5)
         
         # Title (use display name from graph model - may be aliased)
-        display_name = self.graph_model.get_display_name(self.model.name)
-        painter.setPen(QColor(255, 255, 255))
-        font = QFont("Sans", 9, QFont.Bold)
-        painter.setFont(font)
-        painter.drawText(QRectF(margin + self.socket_radius + 5, margin + 5, self.width - 10, 20), Qt.AlignLeft, display_name)
+        self._display_name = self.graph_model.get_display_name(self.model.name)
+        self._title_static = _static_text(self._display_name, title_font)
+        self._title_pos = QPointF(margin + self.socket_radius + 5, margin + 5)
         
-        # Input ports (left side)
+        # Input labels are left-aligned after the socket
+        self._input_labels = []
         y = margin + 30
-        painter.setFont(QFont("Sans", 8))
         for port in self.model.inputs:
-            # Use different color for MIDI ports (purple/magenta)
-            if port.is_midi:
-                painter.setBrush(QColor(200, 100, 255))  # Purple for MIDI inputs
-            else:
-                painter.setBrush(QColor(100, 100, 255))  # Blue for audio inputs
-            painter.drawEllipse(QPointF(margin + self.socket_radius, y), self.socket_radius, self.socket_radius)
-            painter.setPen(QColor(200, 200, 200))
-            painter.drawText(QRectF(margin + self.socket_radius + 12, y - 8, self.width - 24, 16), Qt.AlignLeft, port.name)
+            pos = QPointF(margin + self.socket_radius + 12, y - 8)
+            self._input_labels.append((pos, _static_text(port.name, port_font)))
             y += 18
         
-        # Output ports (right side)
+        # Output labels are right-aligned before the socket
+        self._output_labels = []
         y = margin + 30
+        right = margin + self.socket_radius + self.width - 12
         for port in self.model.outputs:
-            # Use different color for MIDI ports (orange/yellow)
-            if port.is_midi:
-                painter.setBrush(QColor(255, 200, 100))  # Orange for MIDI outputs
-            else:
-                painter.setBrush(QColor(100, 255, 100))  # Green for audio outputs
-            painter.drawEllipse(QPointF(margin + self.socket_radius + self.width, y), self.socket_radius, self.socket_radius)
-            painter.setPen(QColor(200, 200, 200))
-            painter.drawText(QRectF(margin + self.socket_radius + 12, y - 8, self.width - 24, 16), Qt.AlignRight, port.name)
+            pos = QPointF(right - _port_width(port.name), y - 8)
+            self._output_labels.append((pos, _static_text(port.name, port_font)))
             y += 18
     
+    def _build_paint_groups(self):
+        """Group sockets by brush and pick the background so paint does no per-port work."""
+        groups = {}
+        for x, y, port, is_output in self._port_centers:
+            if is_output:
+                brush = _MIDI_OUT_BRUSH if port.is_midi else _AUDIO_OUT_BRUSH
+            else:
+                brush = _MIDI_IN_BRUSH if port.is_midi else _AUDIO_IN_BRUSH
+            groups.setdefault(id(brush), (brush, []))[1].append(QPointF(x, y))
+        self._socket_groups = list(groups.values())
+        self._labels = self._input_labels + self._output_labels
+        
+        # Background: three-way color scheme based on port types
+        all_ports = self.model.inputs + self.model.outputs
+        has_audio = any(not p.is_midi for p in all_ports)
+        has_midi = any(p.is_midi for p in all_ports)
+        if has_audio and has_midi:
+            self._background_brush = _NODE_BRUSH_MIXED
+        elif has_midi:
+            self._background_brush = _NODE_BRUSH_MIDI
+        elif has_audio:
+            self._background_brush = _NODE_BRUSH_AUDIO
+        else:
+            self._background_brush = _NODE_BRUSH_EMPTY
+    
+    def _calculate_height(self):
+        """Calculate node height based on port count."""
+        max_ports = max(len(self.model.inputs), len(self.model.outputs), 1)
+        return max(100, 30 + max_ports * 18 + 10)
+    
+    def boundingRect(self):
+        # Cached by _calculate_size; Qt calls this constantly while indexing/painting
+        return self._bounding_rect
+    
+    def paint(self, painter, option, widget):
+        # Skip everything when none of the node is exposed (e.g. zoomed-in edits)
+        exposed = option.exposedRect
+        if not exposed.intersects(self._bounding_rect):
+            return
+        
+        # Only rows overlapping the exposed band need drawing
+        top = exposed.top() - 8
+        bottom = exposed.bottom() + 8
+        
+        # Background (offset to center within margin)
+        margin = 10
+        painter.setBrush(self._background_brush)
+        painter.setPen(_NODE_BORDER_PEN)
+        painter.drawRoundedRect(margin + self.socket_radius, margin, self.width, self._cached_height, 5, 5)
+        
+        # Title (prepared in _build_static_text; fonts must match the prepared ones)
+        title_font, port_font, _, _ = _fonts()
+        painter.setPen(_TITLE_PEN)
+        painter.setFont(title_font)
+        painter.drawStaticText(self._title_pos, self._title_static)
+        
+        # Sockets, one brush change per color group
+        painter.setPen(_LABEL_PEN)
+        r = self.socket_radius
+        for brush, centers in self._socket_groups:
+            painter.setBrush(brush)
+            for center in centers:
+                if top <= center.y() <= bottom:
+                    painter.drawEllipse(center, r, r)
+        
+        # Port labels, all with the same pen and font
+        painter.setFont(port_font)
+        for label_pos, label in self._labels:
+            if top <= label_pos.y() + 8 <= bottom:
+                painter.drawStaticText(label_pos, label)
+    
     def itemChange(self, change, value):
         # Update model when position changes - but DON'T emit changed signal during drag
         if change == QGraphicsItem.ItemPositionHasChanged:
@@ -304,63 +596,34 @@ class NodeGraphicsItem(QGraphicsItem):
             # Update model silently (no signal emission)
             self.model.x = pos.x()
             self.model.y = pos.y()
-            # Update ALL connections - more reliable than searching
+            # Queue updates for only the connections attached to this node
             scene = self.scene()
             if scene and scene.views():
                 view = scene.views()[0]
-                if hasattr(view, 'connection_items'):
-                    for conn_item in view.connection_items:
-                        # Extract client name from port names for matching
-                        out_client = conn_item.conn.output_port.split(':')[0]
-                        in_client = conn_item.conn.input_port.split(':')[0]
-                        
-                        # Check if this node is involved (handle system split)
-                        node_matches = False
-                        if self.model.name == out_client or self.model.name == in_client:
-                            node_matches = True
-                        elif "system" in self.model.name and (out_client == "system" or in_client == "system"):
-                            # Handle system (capture) and system (playback) nodes
-                            node_matches = True
-                        
-                        if node_matches:
-                            conn_item.update_path()
+                if hasattr(view, 'schedule_path_updates'):
+                    view.schedule_path_updates(self.model.name)
         return super().itemChange(change, value)
     
     def get_port_scene_pos(self, port_name: str, is_output: bool) -> QPointF:
         """Get scene position of a port."""
-        ports = self.model.outputs if is_output else self.model.inputs
-        margin = 10
-        for i, port in enumerate(ports):
-            if port.name == port_name:
-                y = margin + 30 + i * 18
-                # Account for margin and socket_radius offset in boundingRect
-                x = (margin + self.socket_radius + self.width) if is_output else (margin + self.socket_radius)
-                return self.mapToScene(QPointF(x, y))
-        return self.scenePos()
+        offset = self._port_offsets.get((port_name, is_output))
+        if offset is None:
+            return self.scenePos()
+        return self.mapToScene(offset)
     
     def get_port_at_pos(self, pos: QPointF) -> tuple[Optional[PortModel], bool]:
         """Check if position is over a port. Returns (port, is_output) or (None, False)."""
-        margin = 10
-        socket_radius = self.socket_radius
-        
-        # Check input ports (left side)
-        y = margin + 30
-        for port in self.model.inputs:
-            port_center = QPointF(margin + socket_radius, y)
-            distance = (pos - port_center).manhattanLength()
-            if distance < socket_radius * 2:  # Click area slightly larger than socket
-                return (port, False)
-            y += 18
-        
-        # Check output ports (right side)
-        y = margin + 30
-        for port in self.model.outputs:
-            port_center = QPointF(margin + socket_radius + self.width, y)
-            distance = (pos - port_center).manhattanLength()
-            if distance < socket_radius * 2:
-                return (port, True)
-            y += 18
-        
+        px, py = pos.x(), pos.y()
+        pick_radius = self.socket_radius * 2
+        pick_radius_sq = self._port_pick_radius_sq
+        for x, y, port, is_output in self._port_centers:
+            dx = px - x
+            dy = py - y
+            # Cheap box reject first; most sockets fail here
+            if dx > pick_radius or dx < -pick_radius or dy > pick_radius or dy < -pick_radius:
+                continue
+            if dx * dx + dy * dy < pick_radius_sq:
+                return (port, is_output)
         return (None, False)
     
     def mousePressEvent(self, event):
@@ -374,12 +637,15 @@ class NodeGraphicsItem(QGraphicsItem):
                 self._drag_start_port = port
                 self._drag_is_output = is_output
                 event.accept()
-                # Notify view to start drawing temp connection
+                # Notify view to start drawing temp connection; keep the view
+                # so move events during the drag don't look it up again
+                self._drag_view = None
                 if self.scene() and self.scene().views():
                     view = self.scene().views()[0]
                     if hasattr(view, 'start_connection_drag'):
                         start_pos = self.get_port_scene_pos(port.name, is_output)
                         view.start_connection_drag(start_pos, port.full_name, is_output)
+                        self._drag_view = view
                 return
         elif event.button() == Qt.RightButton:
             # Show context menu for renaming
@@ -389,14 +655,19 @@ class NodeGraphicsItem(QGraphicsItem):
         
         # Not clicking on port, allow normal drag
         super().mousePressEvent(event)
+        # Remember where the nodes being dragged started (after the press has
+        # updated the selection), so release can tell which actually moved
+        scene = self.scene()
+        items = {self, *scene.selectedItems()} if scene else {self}
+        self._press_positions = {
+            item: item.pos() for item in items if type(item) is NodeGraphicsItem
+        }
     
     def _show_context_menu(self, pos):
         """Show context menu for node operations."""
-        from PySide6.QtWidgets import QMenu
-        
         menu = QMenu()
         
-        current_display = self.graph_model.get_display_name(self.model.name)
+        current_display = self._display_name
         is_aliased = current_display != self.model.name
         
         rename_action = menu.addAction("Rename Client...")
@@ -422,10 +693,8 @@ class NodeGraphicsItem(QGraphicsItem):
     def mouseMoveEvent(self, event):
         """Update temp connection line if dragging."""
         if self._dragging_connection:
-            if self.scene() and self.scene().views():
-                view = self.scene().views()[0]
-                if hasattr(view, 'update_connection_drag'):
-                    view.update_connection_drag(self.mapToScene(event.pos()))
+            if self._drag_view is not None:
+                self._drag_view.update_connection_drag(event.scenePos())
             event.accept()
         else:
             super().mouseMoveEvent(event)
@@ -433,14 +702,21 @@ class NodeGraphicsItem(QGraphicsItem):
     def mouseReleaseEvent(self, event):
         """Complete connection if released over valid port."""
         if self._dragging_connection:
-            # Check if released over a port
-            items = self.scene().items(self.mapToScene(event.pos()))
+            # Check if released over a port. A tiny rect tested against bounding
+            # rects only avoids per-item shape tests; node bounds already
+            # include the sockets.
+            scene_pos = self.mapToScene(event.pos())
+            items = self.scene().items(
+                QRectF(scene_pos.x() - 1, scene_pos.y() - 1, 2, 2),
+                Qt.IntersectsItemBoundingRect,
+                Qt.DescendingOrder,
+            )
             target_port = None
             target_is_output = False
             
             for item in items:
-                if isinstance(item, NodeGraphicsItem) and item != self:
-                    port, is_output = item.get_port_at_pos(item.mapFromScene(self.mapToScene(event.pos())))
+                if type(item) is NodeGraphicsItem and item is not self:
+                    port, is_output = item.get_port_at_pos(item.mapFromScene(scene_pos))
                     if port:
                         target_port = port
                         target_is_output = is_output
@@ -454,9 +730,17 @@ class NodeGraphicsItem(QGraphicsItem):
             
             self._dragging_connection = False
             self._drag_start_port = None
+            self._drag_view = None
             event.accept()
         else:
             super().mouseReleaseEvent(event)
+            # Publish final positions once per drag rather than on every step,
+            # and only for nodes that actually moved (a plain click moves none);
+            # a rubber-band selection moves all selected nodes together
+            press_positions, self._press_positions = self._press_positions, {}
+            for item, start_pos in press_positions.items():
+                if item.pos() != start_pos:
+                    item.graph_model.nodeMoved.emit(item.model.name, item.model.x, item.model.y)
     
     def hoverMoveEvent(self, event):
         """Update cursor based on whether hovering over a port socket."""
@@ -484,28 +768,52 @@ class ConnectionGraphicsItem(QGraphicsItem):
         self.node_items = node_items
         self.setZValue(-1)  # Behind nodes
         self.path = QPainterPath()
+        self._bounding_rect = QRectF()
+        self._last_endpoints = None  # (sx, sy, ex, ey) the path was built from
         self.setAcceptHoverEvents(True)  # Enable hover for highlighting
         self.setFlag(QGraphicsItem.ItemIsSelectable, True)  # Make selectable
+        self.setFlag(QGraphicsItem.ItemUsesExtendedStyleOption, True)  # Populate option.exposedRect
         self._hovered = False
+        # Resolve (node name, port name) for both ends once; see resolve_endpoint
+        self.out_endpoint = self.resolve_endpoint(conn.output_port, is_output=True)
+        self.in_endpoint = self.resolve_endpoint(conn.input_port, is_output=False)
         self.update_path()
     
+    @staticmethod
+    def resolve_endpoint(full_port_name: str, is_output: bool) -> Optional[Tuple[str, str]]:
+        """Map a full JACK port name to (node name, short port name) in the view."""
+        if ':' not in full_port_name:
+            return None
+        
+        # Get the actual client name from the port (not aliased)
+        original_client_name, _, port_name = full_port_name.partition(':')
+        
+        client_name = original_client_name
+        
+        # system and a2j clients are split by port direction, matching
+        # how the refresh places their ports on capture/playback nodes
+        if client_name == "system" or client_name.startswith("a2j"):
+            if is_output:
+                client_name = f"{original_client_name} (capture)"
+            else:
+                client_name = f"{original_client_name} (playback)"
+        
+        return client_name, port_name
+    
     def boundingRect(self):
-        return self.path.boundingRect().adjusted(-5, -5, 5, 5)  # Add padding for click area
+        return self._bounding_rect  # Cached by update_path
     
     def paint(self, painter, option, widget):
+        # Padded rect: a horizontal path has a zero-height boundingRect
+        if not option.exposedRect.intersects(self._bounding_rect):
+            return
+        
         # Choose color based on connection type
+        highlighted = self._hovered or self.isSelected()
         if self.conn.is_midi:
-            # MIDI connections: purple/magenta
-            if self._hovered or self.isSelected():
-                painter.setPen(QPen(QColor(255, 100, 255), 4))  # Bright magenta when hovered
-            else:
-                painter.setPen(QPen(QColor(200, 100, 255), 2))  # Purple for MIDI
+            painter.setPen(_MIDI_CONN_HOVER_PEN if highlighted else _MIDI_CONN_PEN)
         else:
-            # Audio connections: orange/yellow
-            if self._hovered or self.isSelected():
-                painter.setPen(QPen(QColor(255, 100, 100), 4))  # Red when hovered
-            else:
-                painter.setPen(QPen(QColor(255, 200, 100), 2))  # Orange for audio
+            painter.setPen(_AUDIO_CONN_HOVER_PEN if highlighted else _AUDIO_CONN_PEN)
         painter.drawPath(self.path)
     
     def hoverEnterEvent(self, event):
@@ -521,12 +829,10 @@ class ConnectionGraphicsItem(QGraphicsItem):
     def mousePressEvent(self, event):
         """Right-click to delete connection."""
         if event.button() == Qt.RightButton:
-            # Get parent widget to access jack_manager or remote_node
+            # The view's controller holds jack_manager or remote_node
             if self.scene() and self.scene().views():
                 view = self.scene().views()[0]
-                parent = view.parent()
-                while parent and not hasattr(parent, 'jack_manager') and not hasattr(parent, 'remote_node'):
-                    parent = parent.parent()
+                parent = getattr(view, 'controller', None)
                 
                 if parent:
                     try:
@@ -536,16 +842,14 @@ class ConnectionGraphicsItem(QGraphicsItem):
                             parent.refresh_from_jack()
                         elif parent.remote_node:
                             # Remote disconnection via gRPC
-                            from verdandi_hall.grpc_client import VerdandiGrpcClient
-                            with VerdandiGrpcClient(parent.remote_node, timeout=10) as client:
-                                response = client.disconnect_jack_ports(self.conn.output_port, self.conn.input_port)
-                                if response.success:
-                                    logger.info(f"Remote disconnection: {response.message}")
-                                    # Trigger remote refresh
-                                    if hasattr(parent, 'remote_refresh_requested'):
-                                        parent.remote_refresh_requested.emit()
-                                else:
-                                    logger.error(f"Failed to disconnect remotely: {response.message}")
+                            client = get_shared_client(parent.remote_node, timeout=10)
+                            response = client.disconnect_jack_ports(self.conn.output_port, self.conn.input_port)
+                            if response.success:
+                                logger.info(f"Remote disconnection: {response.message}")
+                                # Trigger remote refresh
+                                parent.remote_refresh_requested.emit()
+                            else:
+                                logger.error(f"Failed to disconnect remotely: {response.message}")
                     except Exception as e:
                         logger.error(f"Failed to disconnect: {e}", exc_info=True)
             event.accept()
@@ -554,65 +858,66 @@ class ConnectionGraphicsItem(QGraphicsItem):
     
     def update_path(self):
         # Find start and end positions
-        start_pos = self._get_port_pos(self.conn.output_port, is_output=True)
-        end_pos = self._get_port_pos(self.conn.input_port, is_output=False)
+        start_pos = self._get_port_pos(self.out_endpoint, is_output=True)
+        end_pos = self._get_port_pos(self.in_endpoint, is_output=False)
         
         if start_pos and end_pos:
-            # MUST call prepareGeometryChange BEFORE modifying geometry
-            self.prepareGeometryChange()
+            sx, sy = start_pos.x(), start_pos.y()
+            ex, ey = end_pos.x(), end_pos.y()
+            endpoints = (sx, sy, ex, ey)
+            if endpoints == self._last_endpoints:
+                return  # Nothing moved
+            self._last_endpoints = endpoints
             
-            self.path = QPainterPath()
-            self.path.moveTo(start_pos)
+            # Reuse the path object rather than allocating a new one per update
+            self.path.clear()
+            self.path.moveTo(sx, sy)
             
             # Bezier curve
-            dist = abs(end_pos.x() - start_pos.x()) * 0.5
-            self.path.cubicTo(
-                start_pos.x() + dist, start_pos.y(),
-                end_pos.x() - dist, end_pos.y(),
-                end_pos.x(), end_pos.y()
-            )
+            dist = abs(ex - sx) * 0.5
+            self.path.cubicTo(sx + dist, sy, ex - dist, ey, ex, ey)
+            
+            # Only re-index the item when its bounds really moved; the 5px
+            # padding easily absorbs sub-pixel drift
+            new_rect = self.path.boundingRect().adjusted(-5, -5, 5, 5)  # Padding for click area
+            old_rect = self._bounding_rect
+            if (old_rect.isNull()
+                    or abs(new_rect.left() - old_rect.left()) > 1
+                    or abs(new_rect.top() - old_rect.top()) > 1
+                    or abs(new_rect.right() - old_rect.right()) > 1
+                    or abs(new_rect.bottom() - old_rect.bottom()) > 1):
+                # MUST call prepareGeometryChange BEFORE modifying geometry
+                self.prepareGeometryChange()
+                self._bounding_rect = new_rect
             
             # Force redraw
             self.update()
     
-    def _get_port_pos(self, full_port_name: str, is_output: bool) -> Optional[QPointF]:
-        if ':' not in full_port_name:
+    def _get_port_pos(self, endpoint: Optional[Tuple[str, str]], is_output: bool) -> Optional[QPointF]:
+        if endpoint is None:
             return None
-        
-        # Get the actual client name from the port (not aliased)
-        original_client_name = full_port_name.split(':')[0]
-        port_name = ':'.join(full_port_name.split(':')[1:])
-        
-        client_name = original_client_name
-        
-        # Handle system split
-        if client_name == "system":
-            if "capture" in port_name:
-                client_name = "system (capture)"
-            elif "playback" in port_name:
-                client_name = "system (playback)"
-        
-        # Handle a2j split
-        elif client_name.startswith("a2j"):
-            # a2j clients are split based on whether they're input or output ports
-            if is_output:
-                client_name = f"{original_client_name} (capture)"
-            else:
-                client_name = f"{original_client_name} (playback)"
-        
+        client_name, port_name = endpoint
         node_item = self.node_items.get(client_name)
         if node_item:
             return node_item.get_port_scene_pos(port_name, is_output)
         return None
 
 
+# Scene syncs adding/removing at least this many items suspend the BSP index
+# and rebuild it once; smaller deltas update the live index item by item
+_BULK_INDEX_THRESHOLD = 64
+
+
 class GraphCanvas(QGraphicsView):
     """View layer - renders the GraphModel."""
     
-    def __init__(self, model: GraphModel):
+    def __init__(self, model: GraphModel, controller: Optional[NodeCanvasWidget] = None):
         super().__init__()
         self.model = model
+        self.controller = controller  # Widget holding jack_manager / remote_node
         self.scene = QGraphicsScene(-2000, -2000, 4000, 4000)
+        self.scene.setItemIndexMethod(QGraphicsScene.BspTreeIndex)
+        self._bsp_depth = None  # Last depth passed to setBspTreeDepth
         self.setScene(self.scene)
         
         self.setRenderHint(QPainter.Antialiasing)
@@ -624,24 +929,53 @@ class GraphCanvas(QGraphicsView):
         
         self.node_items: Dict[str, NodeGraphicsItem] = {}
         self.connection_items: List[ConnectionGraphicsItem] = []
+        # Node name -> connections touching that node, so a node drag only
+        # updates its own connections
+        self.conns_by_client: Dict[str, List[ConnectionGraphicsItem]] = {}
+        
+        # Connections whose paths need recomputing; drained once per event-loop
+        # pass so a burst of node move events costs one update per connection
+        self._dirty_conns: Set[ConnectionGraphicsItem] = set()
+        self._path_update_timer = QTimer(self)
+        self._path_update_timer.setSingleShot(True)
+        self._path_update_timer.setInterval(0)
+        self._path_update_timer.timeout.connect(self._flush_path_updates)
         
         # Temporary connection for drag-to-connect
         self._temp_connection_item = None
+        self._temp_line = None
         self._temp_start_pos = None
         self._temp_start_port = None
         self._temp_start_is_output = False
         
         # Rebuild view when model changes
         self.model.changed.connect(self.rebuild_view)
+        self.model.aliasChanged.connect(self._on_alias_changed)
     
     def wheelEvent(self, event):
         # Smaller zoom increment for finer control (was 1.25/0.8)
         factor = 1.1 if event.angleDelta().y() > 0 else 0.9
         self.scale(factor, factor)
     
+    def _on_alias_changed(self, original_name: str):
+        item = self.node_items.get(original_name)
+        if item:
+            item.refresh_display_name()
+    
+    def schedule_path_updates(self, node_name: str):
+        """Mark a node's connections dirty and queue a coalesced path update."""
+        conns = self.conns_by_client.get(node_name)
+        if conns:
+            self._dirty_conns.update(conns)
+            self._path_update_timer.start()
+    
+    def _flush_path_updates(self):
+        dirty, self._dirty_conns = self._dirty_conns, set()
+        for conn_item in dirty:
+            conn_item.update_path()
+    
     def start_connection_drag(self, start_pos: QPointF, start_port: str, is_output: bool):
         """Start dragging a temporary connection line."""
-        from PySide6.QtWidgets import QGraphicsLineItem
         self._temp_start_pos = start_pos
         self._temp_start_port = start_port
         self._temp_start_is_output = is_output
@@ -652,17 +986,16 @@ class GraphCanvas(QGraphicsView):
         # Create temp line
         self._temp_connection_item = QGraphicsLineItem()
         self._temp_connection_item.setPen(QPen(QColor(255, 255, 0, 180), 3, Qt.DashLine))
-        self._temp_connection_item.setLine(start_pos.x(), start_pos.y(), start_pos.x(), start_pos.y())
+        self._temp_line = QLineF(start_pos, start_pos)  # Mutated in place while dragging
+        self._temp_connection_item.setLine(self._temp_line)
         self._temp_connection_item.setZValue(-2)
         self.scene.addItem(self._temp_connection_item)
     
     def update_connection_drag(self, current_pos: QPointF):
         """Update the temporary connection line."""
         if self._temp_connection_item and self._temp_start_pos:
-            self._temp_connection_item.setLine(
-                self._temp_start_pos.x(), self._temp_start_pos.y(),
-                current_pos.x(), current_pos.y()
-            )
+            self._temp_line.setP2(current_pos)
+            self._temp_connection_item.setLine(self._temp_line)
     
     def end_connection_drag(self, end_port: Optional[str], end_is_output: bool):
         """Complete or cancel the connection drag."""
@@ -692,10 +1025,8 @@ class GraphCanvas(QGraphicsView):
         """Create a JACK connection between two ports."""
         logger.info(f"Attempting to connect: {output_port} -> {input_port}")
         
-        # Get parent widget to access jack_manager or remote_node
-        parent = self.parent()
-        while parent and not hasattr(parent, 'jack_manager') and not hasattr(parent, 'remote_node'):
-            parent = parent.parent()
+        # The controller holds jack_manager or remote_node
+        parent = self.controller
         
         if parent:
             try:
@@ -707,43 +1038,94 @@ class GraphCanvas(QGraphicsView):
                 elif parent.remote_node:
                     # Remote connection via gRPC
                     logger.info(f"Creating remote connection to {parent.remote_node.hostname}")
-                    from verdandi_hall.grpc_client import VerdandiGrpcClient
-                    with VerdandiGrpcClient(parent.remote_node, timeout=10) as client:
-                        response = client.connect_jack_ports(output_port, input_port)
-                        if response.success:
-                            logger.info(f"Remote connection created: {response.message}")
-                            # Trigger remote refresh
-                            if hasattr(parent, 'remote_refresh_requested'):
-                                parent.remote_refresh_requested.emit()
-                        else:
-                            logger.error(f"Failed to create remote connection: {response.message}")
+                    client = get_shared_client(parent.remote_node, timeout=10)
+                    response = client.connect_jack_ports(output_port, input_port)
+                    if response.success:
+                        logger.info(f"Remote connection created: {response.message}")
+                        # Trigger remote refresh
+                        parent.remote_refresh_requested.emit()
+                    else:
+                        logger.error(f"Failed to create remote connection: {response.message}")
             except Exception as e:
                 logger.error(f"Failed to create connection: {e}", exc_info=True)
     
     def rebuild_view(self):
-        """Rebuild all graphics items from model."""
-        # Clear existing items
-        for item in self.connection_items:
-            self.scene.removeItem(item)
-        for item in self.node_items.values():
-            self.scene.removeItem(item)
+        """Sync graphics items with the model, touching only what changed."""
+        nodes = self.model.nodes
+        wanted = {(c.output_port, c.input_port): c for c in self.model.connections}
+        
+        # Size the delta before touching the scene: only a large batch of
+        # adds/removes is worth dropping the BSP index and rebuilding it once;
+        # small changes update the existing index incrementally
+        existing = {(i.conn.output_port, i.conn.input_port) for i in self.connection_items}
+        delta = (
+            len(self.node_items.keys() ^ nodes.keys())
+            + len(existing ^ wanted.keys())
+        )
+        bulk = delta >= _BULK_INDEX_THRESHOLD
+        if bulk:
+            self.scene.setItemIndexMethod(QGraphicsScene.NoIndex)
+        try:
+            self._sync_items(wanted)
+        finally:
+            if bulk:
+                self.scene.setItemIndexMethod(QGraphicsScene.BspTreeIndex)
+            # Pure updates (moves, aliases, MIDI flags) leave the index alone
+            if delta:
+                self._update_bsp_depth()
+    
+    def _update_bsp_depth(self):
+        """Match the BSP tree depth to the item count, only when it crosses a power of two."""
+        item_count = len(self.node_items) + len(self.connection_items)
+        depth = max(4, int(math.log2(max(item_count, 1))))
+        if depth != self._bsp_depth:
+            self._bsp_depth = depth
+            self.scene.setBspTreeDepth(depth)
+    
+    def _sync_items(self, wanted: Dict[Tuple[str, str], ConnectionModel]):
+        nodes = self.model.nodes
+        new_items: List[QGraphicsItem] = []  # Added to the scene in one pass at the end
+        
+        # Nodes: drop stale items, update surviving ones in place, add new ones
+        for name in self.node_items.keys() - nodes.keys():
+            self.scene.removeItem(self.node_items.pop(name))
+        for name, node_model in nodes.items():
+            item = self.node_items.get(name)
+            if item is None:
+                item = NodeGraphicsItem(node_model, self.model)
+                self.node_items[name] = item
+                new_items.append(item)
+            else:
+                item.set_model(node_model)
         
-        self.node_items.clear()
-        self.connection_items.clear()
+        # Connections: keyed by (output_port, input_port); wanted is consumed
+        kept = []
+        for item in self.connection_items:
+            conn = wanted.pop((item.conn.output_port, item.conn.input_port), None)
+            if conn is None:
+                self.scene.removeItem(item)
+                self._dirty_conns.discard(item)
+                continue
+            if conn.is_midi != item.conn.is_midi:
+                item.update()
+            item.conn = conn
+            kept.append(item)
+        for conn in wanted.values():
+            item = ConnectionGraphicsItem(conn, self.model, self.node_items)
+            new_items.append(item)
+            kept.append(item)
+        self.connection_items[:] = kept
         
-        # Create node items
-        for node_model in self.model.nodes.values():
-            item = NodeGraphicsItem(node_model, self.model)
-            self.scene.addItem(item)
-            self.node_items[node_model.name] = item
+        if new_items:
+            for item in new_items:
+                self.scene.addItem(item)
         
-        # Create connection items
-        for conn in self.model.connections:
-            item = ConnectionGraphicsItem(conn, self.model, self.node_items)
-            self.scene.addItem(item)
-            self.connection_items.append(item)
+        self.conns_by_client.clear()
+        for item in self.connection_items:
+            for node_name in {e[0] for e in (item.out_endpoint, item.in_endpoint) if e}:
+                self.conns_by_client.setdefault(node_name, []).append(item)
         
-        # Update connection paths
+        # Update connection paths (no-op for connections whose endpoints didn't move)
         for item in self.connection_items:
             item.update_path()
 
@@ -752,6 +1134,87 @@ class GraphCanvas(QGraphicsView):
 # CONTROLLER WIDGET
 # ============================================================================
 
+class _ConnectBatchSignals(QObject):
+    """Signals for _ConnectBatchWorker (QRunnable itself cannot emit)."""
+    # Connections actually made, preset name, whether to announce completion
+    finished = Signal(list, str, bool)
+
+
+class _ConnectBatchWorker(QRunnable):
+    """Makes a preset's JACK connections off the GUI thread.
+    
+    Each connect_ports call is a round-trip to the JACK server, so a large
+    preset would otherwise stall the event loop for the whole batch.
+    """
+    
+    def __init__(self, jack_manager: JackClientManager, connections: Dict[str, List[str]],
+                 preset_name: str, announce: bool):
+        super().__init__()
+        self.jack_manager = jack_manager
+        self.connections = connections
+        self.preset_name = preset_name
+        self.announce = announce
+        self.signals = _ConnectBatchSignals()
+    
+    def run(self):
+        made = []
+        try:
+            existing = self.jack_manager.get_all_connections()
+            existing_set = {(o, i) for o, ins in existing.items() for i in ins}
+            
+            pairs = [
+                (out_port, in_port)
+                for out_port, in_ports in self.connections.items()
+                for in_port in in_ports
+                if (out_port, in_port) not in existing_set
+            ]
+            failed = self.jack_manager.connect_many(pairs)
+            for out_port, in_port, e in failed:
+                logger.debug("Skipping preset connection %s -> %s: %s", out_port, in_port, e)
+            failed_set = {(o, i) for o, i, _ in failed}
+            made = [pair for pair in pairs if pair not in failed_set]
+        except Exception as e:
+            logger.error("Error applying preset connections: %s", e)
+        finally:
+            self.signals.finished.emit(made, self.preset_name, self.announce)
+
+
+class _HubLookupSignals(QObject):
+    """Signals for _HubLookupWorker."""
+    # (hub_hostname, hub_node_ip, hub_port); hostname/ip are None if no hub is running
+    finished = Signal(object)
+
+
+class _HubLookupWorker(QRunnable):
+    """Looks up the running JackTrip hub in the database off the GUI thread."""
+    
+    def __init__(self):
+        super().__init__()
+        self.signals = _HubLookupSignals()
+    
+    def run(self):
+        hub_node_ip = None
+        hub_hostname = None
+        hub_port = 4464
+        
+        try:
+            db = Database()
+            # Only the columns needed, as plain rows rather than ORM objects
+            with db.get_session() as session:
+                hub_row = session.query(JackTripHub.hub_hostname, JackTripHub.hub_port).first()
+                if hub_row and hub_row.hub_hostname:
+                    hub_hostname = hub_row.hub_hostname
+                    hub_port = hub_row.hub_port or 4464
+                    # Look up the node to get its IP
+                    node_row = session.query(Node.ip_last_seen).filter_by(hostname=hub_hostname).first()
+                    if node_row:
+                        hub_node_ip = node_row.ip_last_seen
+        except Exception as e:
+            logger.error(f"Failed to check for running hub: {e}")
+        finally:
+            self.signals.finished.emit((hub_hostname, hub_node_ip, hub_port))
+
+
 class NodeCanvasWidget(QWidget):
     """Controller - bridges JACK manager and GraphModel."""
     
@@ -775,15 +1238,29 @@ class NodeCanvasWidget(QWidget):
         self.presets_dir.mkdir(parents=True, exist_ok=True)
         
         # Per-node last preset tracking
-        self.last_preset_map_file = Path.home() / ".config" / "verdandi" / "jack_last_presets.json"
-        self.last_preset_map_file.parent.mkdir(parents=True, exist_ok=True)
+        self._last_preset_store = _LastPresetStore.instance()
+        self.last_preset_map_file = self._last_preset_store.path
         
         # Model
         self.model = GraphModel()
         
         # Preset positions to apply
         self._preset_positions = {}
+        # Last known position of every node seen, kept across model rebuilds so
+        # nodes come back where they were
+        self._position_cache: Dict[str, Tuple[float, float]] = {}
+        self.model.nodeMoved.connect(self._on_node_moved)
         self.current_preset_name = None  # Track currently loaded preset
+        self._preset_cache: List[str] = []  # Preset names currently in preset_combo
+        self._jack_signature = None  # JACK ports/connections seen by the last refresh
+        self._refresh_pending = False  # A coalesced refresh_from_jack is queued
+        self._jack_client_names: List[str] = []
+        self._presets_mtime: Optional[int] = None  # presets_dir mtime when last scanned
+        
+        # Preset connections are made on a single worker thread so batches
+        # never overlap and JACK calls stay serialized
+        self._connect_pool = QThreadPool(self)
+        self._connect_pool.setMaxThreadCount(1)
         
         # View
         layout = QVBoxLayout(self)
@@ -810,11 +1287,10 @@ class NodeCanvasWidget(QWidget):
         layout.addLayout(controls)
         
         # Canvas
-        self.canvas = GraphCanvas(self.model)
+        self.canvas = GraphCanvas(self.model, controller=self)
         layout.addWidget(self.canvas)
         
         # Add keyboard shortcut for Ctrl+S to save preset
-        from PySide6.QtGui import QShortcut, QKeySequence
         save_shortcut = QShortcut(QKeySequence("Ctrl+S"), self)
         save_shortcut.activated.connect(self._save_preset)
         
@@ -827,7 +1303,8 @@ class NodeCanvasWidget(QWidget):
         # Only auto-refresh and load preset if we have a jack_manager (local canvas)
         # Remote canvases will be populated manually and then load preset
         if jack_manager:
-            self.refresh_from_jack()
+            # Synchronous: the last preset is matched against the populated model
+            self._refresh_from_jack_impl()
             self._load_last_preset()
         
         self._refresh_preset_list()
@@ -839,11 +1316,27 @@ class NodeCanvasWidget(QWidget):
         """Set or update the JACK manager."""
         self.jack_manager = jack_manager
         if jack_manager:
-            self.refresh_from_jack()
+            self._refresh_from_jack_impl()
             # Load last preset now that we have data
             self._load_last_preset()
     
     def refresh_from_jack(self):
+        """Queue a model update from JACK state.
+        
+        Requests made before the event loop next runs collapse into a single
+        refresh, so back-to-back connect/disconnect/button actions cost one
+        JACK sweep.
+        """
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        QTimer.singleShot(0, self._do_refresh)
+    
+    def _do_refresh(self):
+        self._refresh_pending = False
+        self._refresh_from_jack_impl()
+    
+    def _refresh_from_jack_impl(self):
         """Update model from JACK state."""
         if not self.jack_manager:
             # For remote canvases, emit signal to trigger remote refresh
@@ -851,105 +1344,92 @@ class NodeCanvasWidget(QWidget):
                 self.remote_refresh_requested.emit()
             return
         try:
-            # Get JACK data - include both audio and MIDI ports
-            all_ports = self.jack_manager.get_ports()  # Get all ports (audio + MIDI)
-            output_ports = set(self.jack_manager.get_ports(is_output=True))  # All outputs
-            connections_dict = self.jack_manager.get_all_connections()
-            
-            # Preserve existing node positions (prefer preset positions if available)
-            old_positions = {name: (node.x, node.y) for name, node in self.model.nodes.items()}
-            # Merge with preset positions (preset takes priority)
+            # Get JACK data - include both audio and MIDI ports. One pass over the
+            # JACK port list yields ports, directions, MIDI types and connections
+            port_names, output_names, midi_names, connections_dict = self.jack_manager.snapshot()
+            # Port names repeat across refreshes and key several dicts/sets below,
+            # so intern them once to get identity-fast hashing and comparison
+            all_ports = [sys.intern(p) for p in port_names]  # Audio + MIDI
+            output_ports = frozenset(sys.intern(p) for p in output_names)
+            midi_ports = frozenset(sys.intern(p) for p in midi_names)
+            
+            # Nothing to rebuild if the JACK graph is exactly as we last saw it
+            # (and no preset positions are waiting to be applied)
+            signature = (
+                tuple(all_ports), output_ports, midi_ports,
+                frozenset((o, i) for o, ins in connections_dict.items() for i in ins),
+            )
+            if signature == self._jack_signature and not self._preset_positions:
+                self._detect_jacktrip_state_from_clients(self._jack_client_names)
+                # Hostnames can resolve later than the ports appear (TTL expiry,
+                # a Node row registered since), so retry the alias mapping
+                self._map_jacktrip_clients_to_hostnames(self._jack_client_names)
+                return
+            
+            # Preserve existing node positions (preset positions take priority)
+            old_positions = self._position_cache
             if self._preset_positions:
-                old_positions.update(self._preset_positions)
+                old_positions = {**old_positions, **self._preset_positions}
                 self._preset_positions = {}  # Clear after use
             
             # Batch update - only emit changed once at the end
             self.model.begin_batch()
             
+            # Reuse PortModels from the previous refresh for ports that still
+            # exist unchanged, rather than reallocating every port each time
+            port_pool = {
+                (p.full_name, p.is_output): p
+                for n in self.model.nodes.values() for p in n.inputs + n.outputs
+            }
+            
             # Clear model
             self.model.clear()
             
-            # Group ports by client and detect MIDI ports
-            clients = {}
-            
-            # Detect MIDI ports by checking each port's type
-            midi_ports = set()
+            # Group ports by client into (outputs, inputs) buckets of final
+            # PortModels, so there is no intermediate per-port record to unpack
+            clients: Dict[str, Tuple[List[PortModel], List[PortModel]]] = {}
+            
+            logger.debug("Total ports: %d, MIDI ports: %d", len(all_ports), len(midi_ports))
+            if midi_ports and logger.isEnabledFor(logging.DEBUG):
+                # Only materialize the sample when it will actually be logged
+                logger.debug("Sample MIDI ports: %s", sorted(midi_ports)[:3])
+            
+            # Bind per-port lookups to locals once instead of on every iteration
+            is_output_port = output_ports.__contains__
+            is_midi_port = midi_ports.__contains__
+            pooled_port = port_pool.get
+            new_port = PortModel
+            intern = sys.intern
             for port_name in all_ports:
-                try:
-                    port_obj = self.jack_manager.client.get_port_by_name(port_name)
-                    if port_obj.is_midi:
-                        midi_ports.add(port_name)
-                except Exception as e:
-                    logger.warning(f"Error checking port type for {port_name}: {e}")
-            
-            logger.debug(f"Total ports: {len(all_ports)}, MIDI ports: {len(midi_ports)}")
-            
-            for port_name in all_ports:
-                if ':' not in port_name:
+                client_name, sep, port_short = port_name.partition(':')
+                if not sep:
                     continue
-                client_name = port_name.split(':')[0]
-                port_short = ':'.join(port_name.split(':')[1:])
-                if client_name not in clients:
-                    clients[client_name] = []
-                is_output = port_name in output_ports
-                is_midi = port_name in midi_ports
-                clients[client_name].append((port_short, port_name, is_output, is_midi))
-            
-            logger.info(f"Raw JACK clients before any processing: {list(clients.keys())}")
+                client_name = intern(client_name)
+                port_short = intern(port_short)
+                bucket = clients.get(client_name)
+                if bucket is None:
+                    bucket = clients[client_name] = ([], [])
+                is_output = is_output_port(port_name)
+                is_midi = is_midi_port(port_name)
+                port = pooled_port((port_name, is_output))
+                if port is None or port.is_midi != is_midi:
+                    port = new_port(port_short, port_name, is_output, is_midi)
+                # Sort by direction now so the per-client branches need no re-filtering
+                bucket[0 if is_output else 1].append(port)
+            
+            logger.info("Raw JACK clients before any processing: %s", list(clients))
             
             # Create nodes with auto-layout (but restore old positions if available)
             x, y = 50, 50
-            for client_name, ports in clients.items():
-                if client_name == "system":
-                    # Split system
-                    capture_ports = [(s, f, m) for s, f, _, m in ports if "capture" in s]
-                    playback_ports = [(s, f, m) for s, f, _, m in ports if "playback" in s]
-                    
-                    if capture_ports:
-                        node_name = "system (capture)"
-                        saved_x, saved_y = old_positions.get(node_name, (x, y))
-                        node = self.model.add_node(node_name, saved_x, saved_y)
-                        for port_short, port_full, is_midi in capture_ports:
-                            node.outputs.append(PortModel(port_short, port_full, True, is_midi))
-                        y += 150
-                    
-                    if playback_ports:
-                        node_name = "system (playback)"
-                        saved_x, saved_y = old_positions.get(node_name, (x, y))
-                        node = self.model.add_node(node_name, saved_x, saved_y)
-                        for port_short, port_full, is_midi in playback_ports:
-                            node.inputs.append(PortModel(port_short, port_full, False, is_midi))
-                        y += 150
-                
-                elif client_name.startswith("a2j"):
-                    # Split a2j (MIDI bridge) clients into capture (sources) and playback (sinks)
-                    capture_ports = [(s, f, m) for s, f, is_out, m in ports if is_out]
-                    playback_ports = [(s, f, m) for s, f, is_out, m in ports if not is_out]
-                    
-                    if capture_ports:
-                        node_name = f"{client_name} (capture)"
-                        saved_x, saved_y = old_positions.get(node_name, (x, y))
-                        node = self.model.add_node(node_name, saved_x, saved_y)
-                        for port_short, port_full, is_midi in capture_ports:
-                            node.outputs.append(PortModel(port_short, port_full, True, is_midi))
-                        y += 150
-                    
-                    if playback_ports:
-                        node_name = f"{client_name} (playback)"
-                        saved_x, saved_y = old_positions.get(node_name, (x, y))
-                        node = self.model.add_node(node_name, saved_x, saved_y)
-                        for port_short, port_full, is_midi in playback_ports:
-                            node.inputs.append(PortModel(port_short, port_full, False, is_midi))
-                        y += 150
-                
+            for client_name, (out_ports, in_ports) in clients.items():
+                if client_name == "system" or client_name.startswith("a2j"):
+                    # Split system and a2j (MIDI bridge) clients into capture
+                    # (sources) and playback (sinks) nodes
+                    y = self._add_split_node(client_name, out_ports, in_ports, old_positions, x, y)
                 else:
-                    saved_x, saved_y = old_positions.get(client_name, (x, y))
-                    node = self.model.add_node(client_name, saved_x, saved_y)
-                    for port_short, port_full, is_output, is_midi in ports:
-                        if is_output:
-                            node.outputs.append(PortModel(port_short, port_full, True, is_midi))
-                        else:
-                            node.inputs.append(PortModel(port_short, port_full, False, is_midi))
+                    node = self._place_node(client_name, old_positions, x, y)
+                    node.outputs.extend(out_ports)
+                    node.inputs.extend(in_ports)
                     
                     x += 200
                     if x > 800:
@@ -969,46 +1449,62 @@ class NodeCanvasWidget(QWidget):
             
             # End batch - trigger single rebuild
             self.model.end_batch()
+            
+            self._jack_signature = signature
+            self._jack_client_names = list(clients)
         
         except Exception as e:
-            logger.error(f"Error refreshing from JACK: {e}", exc_info=True)
+            # Only walk the traceback when debugging; a broken JACK server can make
+            # this path fire on every refresh
+            logger.error("Error refreshing from JACK: %s", e,
+                         exc_info=logger.isEnabledFor(logging.DEBUG))
+    
+    def _place_node(self, node_name: str, positions: Dict[str, Tuple[float, float]],
+                    x: float, y: float) -> NodeModel:
+        """Add a node at its known position (or the auto-layout slot) and remember it."""
+        pos = positions.get(node_name, (x, y))
+        self._position_cache[node_name] = pos
+        return self.model.add_node(node_name, *pos)
+    
+    def _add_split_node(self, base_name: str, out_ports: List[PortModel], in_ports: List[PortModel],
+                        positions: Dict[str, Tuple[float, float]], x: float, y: float) -> float:
+        """Add "<base> (capture)" / "<base> (playback)" nodes; returns the next auto-layout y."""
+        if out_ports:
+            node = self._place_node(f"{base_name} (capture)", positions, x, y)
+            node.outputs.extend(out_ports)
+            y += 150
+        if in_ports:
+            node = self._place_node(f"{base_name} (playback)", positions, x, y)
+            node.inputs.extend(in_ports)
+            y += 150
+        return y
+    
+    def _on_node_moved(self, name: str, x: float, y: float):
+        self._position_cache[name] = (x, y)
     
     def _map_jacktrip_clients_to_hostnames(self, client_names: List[str]):
         """Map JackTrip IP address clients to hostnames using database lookup."""
-        import re
-        from verdandi_codex.database import Database
-        from verdandi_codex.models.identity import Node
-        
-        # Pattern to match JackTrip IP-based client names like "__ffff_192.168.32.9"
-        ip_pattern = re.compile(r'__ffff_(\d+\.\d+\.\d+\.\d+)')
-        
         for client_name in client_names:
-            match = ip_pattern.match(client_name)
-            if match:
-                ip_address = match.group(1)
+            # JackTrip IP-based client names like "__ffff_192.168.32.9"
+            ip_address = _jacktrip_client_ip(client_name)
+            if ip_address:
                 try:
                     # Look up hostname in database
-                    db = Database()
-                    with db.get_session() as session:
-                        node = session.query(Node).filter_by(ip_last_seen=ip_address).first()
-                        if node:
-                            # Set alias to display hostname instead of IP
-                            self.model.set_alias(client_name, node.hostname)
-                            logger.info(f"Mapped JackTrip client {ip_address} to {node.hostname}")
+                    hostname = _hostname_for_ip(ip_address)
+                    if hostname and self.model.aliases.get(client_name) != hostname:
+                        # Set alias to display hostname instead of IP
+                        self.model.set_alias(client_name, hostname)
+                        logger.info(f"Mapped JackTrip client {ip_address} to {hostname}")
                 except Exception as e:
                     logger.warning(f"Failed to map JackTrip client {ip_address}: {e}")
     
     def _detect_jacktrip_state_from_clients(self, client_names: List[str]):
         """Detect if JackTrip hub or client is running based on JACK client names."""
-        import re
         has_hub = False
         has_client = False
         
         logger.info(f"Detecting JackTrip state from clients: {client_names}")
         
-        # Pattern to match JackTrip IP-based client names
-        ip_pattern = re.compile(r'__ffff_\d+\.\d+\.\d+\.\d+')
-        
         for client_name in client_names:
             client_lower = client_name.lower()
             # Check for JackTrip hub
@@ -1016,7 +1512,7 @@ class NodeCanvasWidget(QWidget):
                 has_hub = True
                 logger.info(f"Detected hub: {client_name}")
             # Check for JackTrip clients (IP-based names or containing "jacktrip")
-            elif ip_pattern.match(client_name) or ("jacktrip" in client_lower and client_lower != "jacktrip"):
+            elif _jacktrip_client_ip(client_name) or ("jacktrip" in client_lower and client_lower != "jacktrip"):
                 has_client = True
                 logger.info(f"Detected client: {client_name}")
         
@@ -1031,10 +1527,7 @@ class NodeCanvasWidget(QWidget):
     def _get_last_preset_for_node(self) -> Optional[str]:
         """Get the last used preset name for this node."""
         try:
-            if self.last_preset_map_file.exists():
-                with open(self.last_preset_map_file, 'r') as f:
-                    preset_map = json.load(f)
-                    return preset_map.get(self.node_id)
+            return self._last_preset_store.get(self.node_id)
         except Exception as e:
             logger.error(f"Failed to read last preset map: {e}")
         return None
@@ -1042,15 +1535,7 @@ class NodeCanvasWidget(QWidget):
     def _set_last_preset_for_node(self, preset_name: str):
         """Store the last used preset name for this node."""
         try:
-            preset_map = {}
-            if self.last_preset_map_file.exists():
-                with open(self.last_preset_map_file, 'r') as f:
-                    preset_map = json.load(f)
-            
-            preset_map[self.node_id] = preset_name
-            
-            with open(self.last_preset_map_file, 'w') as f:
-                json.dump(preset_map, f, indent=2)
+            self._last_preset_store.set(self.node_id, preset_name)
         except Exception as e:
             logger.error(f"Failed to write last preset map: {e}")
     
@@ -1072,19 +1557,23 @@ class NodeCanvasWidget(QWidget):
                     "pos": (n.x, n.y)
                 })
 
+            # Group by output port so fan-out connections are all kept
+            connections = defaultdict(list)
+            for c in self.model.connections:
+                connections[c.output_port].append(c.input_port)
+            
             data = {
                 "name": name,
-                "connections": {c.output_port: [c.input_port] for c in self.model.connections},
+                "connections": dict(connections),
                 # Legacy map for backward compatibility; keep alongside the richer V2 data
                 "positions": {n.name: (n.x, n.y) for n in self.model.nodes.values()},
                 "positions_v2": positions_v2,
-                "aliases": self.model.aliases.copy(),  # Save client aliases
+                "aliases": self.model.aliases,  # Save client aliases (serialized, not mutated)
                 "zoom_level": zoom_level  # Save zoom level
             }
             
             path = self.presets_dir / f"{name}.json"
-            with open(path, 'w') as f:
-                json.dump(data, f, indent=2)
+            _write_json_atomic(path, data)
             
             # Mark as current and last used preset for this node
             self.current_preset_name = name
@@ -1106,8 +1595,7 @@ class NodeCanvasWidget(QWidget):
         if not path.exists():
             return
         
-        with open(path, 'r') as f:
-            data = json.load(f)
+        data = _read_json(path)
         
         # Store positions to be applied during next refresh
         self._preset_positions = data.get("positions", {})
@@ -1139,40 +1627,96 @@ class NodeCanvasWidget(QWidget):
                 if node_name in self.model.nodes:
                     self.model.move_node(node_name, x, y)
         
-        # Apply connections (only for local canvas with jack_manager)
+        # Mark as current and last used preset for this node
+        self.current_preset_name = name
+        self._set_last_preset_for_node(name)
+        
+        # Apply connections (only for local canvas with jack_manager); the
+        # success message is shown once the worker finishes
         if self.jack_manager:
-            for out_port, in_ports in data.get("connections", {}).items():
-                for in_port in in_ports:
-                    try:
-                        self.jack_manager.connect_ports(out_port, in_port)
-                    except:
-                        pass
+            self._apply_preset_connections(data.get("connections", {}), name, announce=True)
+            return
         
         # For remote canvases, connections are managed on the remote system
         # and will be displayed when the graph is refreshed
+        QMessageBox.information(self, "Success", f"Preset '{name}' loaded!")
+    
+    def _apply_preset_connections(self, connections: Dict[str, List[str]], name: str, announce: bool):
+        """Make a preset's JACK connections on the worker thread.
         
-        # Mark as current and last used preset for this node
-        self.current_preset_name = name
-        self._set_last_preset_for_node(name)
+        The model is updated from _on_preset_connections_made once the batch
+        completes; a refresh is only queued if preset positions are pending.
+        """
+        worker = _ConnectBatchWorker(self.jack_manager, connections, name, announce)
+        worker.signals.finished.connect(self._on_preset_connections_made)
+        self._connect_pool.start(worker)
+    
+    def _on_preset_connections_made(self, made: list, name: str, announce: bool):
+        """Add connections made by a _ConnectBatchWorker to the model (GUI thread)."""
+        self.model.begin_batch()
+        try:
+            for out_port, in_port in made:
+                self.model.add_connection(out_port, in_port)
+        finally:
+            self.model.end_batch()
         
-        # Refresh if jack_manager available to apply connections
-        if self.jack_manager:
+        # Positions for nodes that did not exist when the preset was loaded
+        # are applied by the next refresh; queue one rather than wait for an
+        # unrelated graph change
+        if self._preset_positions:
             self.refresh_from_jack()
-        # For remote canvases, don't refresh - positions are already applied
         
-        QMessageBox.information(self, "Success", f"Preset '{name}' loaded!")
+        if announce:
+            QMessageBox.information(self, "Success", f"Preset '{name}' loaded!")
     
     def _refresh_preset_list(self):
-        current = self.preset_combo.currentText()
-        self.preset_combo.clear()
-        
-        presets = [p.stem for p in self.presets_dir.glob("*.json")]
-        presets.sort()
-        self.preset_combo.addItems(presets)
+        # Skip the directory scan entirely if nothing was added or removed
+        try:
+            mtime = self.presets_dir.stat().st_mtime_ns
+        except OSError:
+            mtime = None
+        if mtime is not None and mtime == self._presets_mtime:
+            return
+        self._presets_mtime = mtime
+        
+        # A plain suffix check on scandir entries avoids glob's fnmatch and
+        # the per-entry Path objects
+        with os.scandir(self.presets_dir) as entries:
+            presets = sorted(e.name[:-5] for e in entries if e.name.endswith(".json"))
+        old = self._preset_cache
+        if presets == old:
+            return
+        if not old:
+            # First fill - add everything in one call
+            self.preset_combo.blockSignals(True)
+            try:
+                self.preset_combo.addItems(presets)
+            finally:
+                self.preset_combo.blockSignals(False)
+            self._preset_cache = presets
+            return
         
-        idx = self.preset_combo.findText(current)
-        if idx >= 0:
-            self.preset_combo.setCurrentIndex(idx)
+        # Walk both sorted lists and insert/remove only the differences, so the
+        # combo keeps its selection and avoids a full model reset
+        combo = self.preset_combo
+        combo.blockSignals(True)
+        try:
+            i = j = idx = 0
+            while i < len(old) or j < len(presets):
+                if j >= len(presets) or (i < len(old) and old[i] < presets[j]):
+                    combo.removeItem(idx)
+                    i += 1
+                elif i >= len(old) or presets[j] < old[i]:
+                    combo.insertItem(idx, presets[j])
+                    idx += 1
+                    j += 1
+                else:
+                    idx += 1
+                    i += 1
+                    j += 1
+        finally:
+            combo.blockSignals(False)
+        self._preset_cache = presets
     
     def _load_last_preset(self):
         """Automatically load the last used preset for this node."""
@@ -1204,8 +1748,7 @@ class NodeCanvasWidget(QWidget):
             return
         
         try:
-            with open(path, 'r') as f:
-                data = json.load(f)
+            data = _read_json(path)
             
             # Store positions to be applied during next refresh
             self._preset_positions = data.get("positions", {})
@@ -1234,21 +1777,17 @@ class NodeCanvasWidget(QWidget):
                     if node_name in self.model.nodes:
                         self.model.move_node(node_name, x, y)
             
+            # Rebuild the view with the loaded aliases and positions now;
+            # connections follow when the worker finishes
+            self.model.changed.emit()
+            
             # Apply connections (only if jack_manager available)
             if self.jack_manager:
-                for out_port, in_ports in data.get("connections", {}).items():
-                    for in_port in in_ports:
-                        try:
-                            self.jack_manager.connect_ports(out_port, in_port)
-                        except:
-                            pass
+                self._apply_preset_connections(data.get("connections", {}), name, announce=False)
             
             # Mark as current preset
             self.current_preset_name = name
             
-            # Just rebuild the view with updated positions - don't refresh from source
-            self.model.changed.emit()
-            
             logger.info(f"Auto-loaded preset '{name}' for node {self.node_id}")
         except Exception as e:
             logger.error(f"Error loading preset: {e}")
@@ -1279,6 +1818,10 @@ class JackCanvasWithControls(QWidget):
         self.client_connected = False
         self.hub_host = None
         self.hub_port = 4464
+        # JackTrip processes started from this panel, so they can be stopped
+        # directly instead of searching the process table
+        self._hub_proc = None
+        self._client_proc = None
         
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -1297,6 +1840,12 @@ class JackCanvasWithControls(QWidget):
         )
         layout.addWidget(self.canvas)
         
+        # Delayed refresh after JackTrip actions; restarting it coalesces
+        # rapid actions into a single refresh
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.timeout.connect(self.canvas.refresh_from_jack)
+        
         # Connect to canvas's jacktrip state detection BEFORE setting jack_manager
         self.canvas._jacktrip_state_detected = self._on_jacktrip_state_detected
         
@@ -1307,29 +1856,26 @@ class JackCanvasWithControls(QWidget):
         # Query database for initial state
         self._sync_state_from_database()
     
+    def _schedule_refresh(self, ms: int = 1000):
+        """Refresh the canvas after ms, replacing any refresh already pending."""
+        self._refresh_timer.start(ms)
+    
     def _sync_state_from_database(self):
         """Query database for current JackTrip state and update button states."""
-        from verdandi_codex.config import VerdandiConfig
-        from verdandi_codex.database import Database
-        from verdandi_codex.models.jacktrip import JackTripHub, JackTripClient
-        
         try:
             config = VerdandiConfig.load()
             db = Database(config.database)
-            session = db.get_session()
-            
-            # Check if hub is running
-            hub = session.query(JackTripHub).first()
-            hub_running = hub and hub.hub_node_id is not None
-            hub_is_local = hub_running and str(hub.hub_node_id) == str(config.node.node_id)
-            
-            # Check if this node is connected as client
-            client = session.query(JackTripClient).filter_by(
-                client_node_id=config.node.node_id
-            ).first()
-            client_connected = client is not None
-            
-            session.close()
+            with db.get_session() as session:
+                # Check if hub is running
+                hub = session.query(JackTripHub.hub_node_id).first()
+                hub_running = hub and hub.hub_node_id is not None
+                hub_is_local = hub_running and str(hub.hub_node_id) == str(config.node.node_id)
+                
+                # Check if this node is connected as client
+                client = session.query(JackTripClient.client_node_id).filter_by(
+                    client_node_id=config.node.node_id
+                ).first()
+                client_connected = client is not None
             
             logger.info(f"Database state: hub_running={hub_running}, hub_is_local={hub_is_local}, client_connected={client_connected}")
             
@@ -1479,8 +2025,6 @@ class JackCanvasWithControls(QWidget):
     
     def _on_start_hub(self):
         """Start JackTrip hub server."""
-        from PySide6.QtWidgets import QDialog, QFormLayout, QSpinBox, QDialogButtonBox
-        
         # Configuration dialog
         dialog = QDialog(self)
         dialog.setWindowTitle("Start JackTrip Hub")
@@ -1508,35 +2052,27 @@ class JackCanvasWithControls(QWidget):
         try:
             if self.is_remote:
                 # Start hub on remote node via gRPC
-                from verdandi_hall.grpc_client import VerdandiGrpcClient
-                with VerdandiGrpcClient(self.remote_node, timeout=30) as client:
-                    response = client.start_jacktrip_hub(
-                        send_channels=2,  # Default, clients will specify their own
-                        receive_channels=2,
-                        sample_rate=48000,
-                        buffer_size=256,
-                        port=port
-                    )
+                client = get_shared_client(self.remote_node, timeout=30)
+                response = client.start_jacktrip_hub(
+                    send_channels=2,  # Default, clients will specify their own
+                    receive_channels=2,
+                    sample_rate=48000,
+                    buffer_size=256,
+                    port=port
+                )
                 location = f"on {self.remote_node.hostname}"
             else:
                 # Start hub locally via subprocess
-                import subprocess
                 cmd = [
                     "jacktrip", "-S",  # Hub server mode
                     "--bindport", str(port),
                     "--clientname", "Hub_Server"  # Name it "Hub Server" in JACK
                 ]
+                # Don't fork jacktrip just to watch it fail on a taken port
+                if self._local_port_in_use(port):
+                    raise Exception(f"Failed to start local hub: port {port} is already in use")
                 try:
-                    # Start process and capture output for error checking
-                    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-                    # Give it a moment to fail if there's an immediate error
-                    import time
-                    time.sleep(0.5)
-                    poll = proc.poll()
-                    if poll is not None:
-                        # Process died, get error
-                        _, stderr = proc.communicate()
-                        raise Exception(f"JackTrip hub failed to start: {stderr.decode()}")
+                    self._hub_proc = self._launch_local_jacktrip(cmd, "hub", timeout=0.5)
                     location = "locally"
                 except Exception as e:
                     raise Exception(f"Failed to start local hub: {e}")
@@ -1548,9 +2084,6 @@ class JackCanvasWithControls(QWidget):
             self.status_label.setText(f"Status: <b style='color: #6f6'>Hub Running</b> (port {port})")
             
             # Save hub info to database
-            from verdandi_codex.database import Database
-            from verdandi_codex.models.jacktrip import JackTripHub
-            from verdandi_codex.models.identity import Node
             try:
                 db = Database()
                 session = db.get_session()
@@ -1561,9 +2094,8 @@ class JackCanvasWithControls(QWidget):
                     hub_hostname = self.remote_node.hostname
                 else:
                     # Get local node
-                    import socket
-                    local_hostname = socket.gethostname().split('.')[0]
-                    node = session.query(Node).filter_by(hostname=local_hostname).first()
+                    local_hostname = _local_hostname()
+                    node = session.query(Node.node_id).filter_by(hostname=local_hostname).first()
                     hub_node_id = node.node_id if node else None
                     hub_hostname = local_hostname
                 
@@ -1595,8 +2127,7 @@ class JackCanvasWithControls(QWidget):
                                   f"Clients can now connect.")
             
             # Refresh canvas after a moment to show new JACK client
-            from PySide6.QtCore import QTimer
-            QTimer.singleShot(1000, self.canvas.refresh_from_jack)
+            self._schedule_refresh()
             
             # Sync button states from database
             self._sync_state_from_database()
@@ -1608,17 +2139,10 @@ class JackCanvasWithControls(QWidget):
     def _on_stop_hub(self):
         """Stop JackTrip hub server."""
         try:
-            if self.is_remote:
-                # Stop hub on remote node via gRPC
-                from verdandi_hall.grpc_client import VerdandiGrpcClient
-                with VerdandiGrpcClient(self.remote_node, timeout=30) as client:
-                    response = client.stop_jacktrip_hub()
-                location = f"on {self.remote_node.hostname}"
-            else:
-                # Stop hub locally
-                import subprocess
-                subprocess.run(["pkill", "-f", "jacktrip.*-S"], check=False)
-                location = "locally"
+            location = self._stop_jacktrip(
+                lambda client: client.stop_jacktrip_hub(), self._hub_proc, "jacktrip.*-S"
+            )
+            self._hub_proc = None
             
             self.hub_running = False
             self.start_hub_btn.setEnabled(True)
@@ -1626,8 +2150,6 @@ class JackCanvasWithControls(QWidget):
             self.status_label.setText("Status: <i>Idle</i>")
             
             # Clear hub info from database
-            from verdandi_codex.database import Database
-            from verdandi_codex.models.jacktrip import JackTripHub
             try:
                 db = Database()
                 session = db.get_session()
@@ -1645,8 +2167,7 @@ class JackCanvasWithControls(QWidget):
             QMessageBox.information(self, "Hub Stopped", f"JackTrip hub server stopped {location}.")
             
             # Refresh canvas
-            from PySide6.QtCore import QTimer
-            QTimer.singleShot(1000, self.canvas.refresh_from_jack)
+            self._schedule_refresh()
             
             # Sync button states from database
             self._sync_state_from_database()
@@ -1657,30 +2178,19 @@ class JackCanvasWithControls(QWidget):
     
     def _on_connect_client(self):
         """Connect as client to a hub."""
-        from PySide6.QtWidgets import QDialog, QFormLayout, QComboBox, QSpinBox, QDialogButtonBox
-        from verdandi_codex.database import Database
-        from verdandi_codex.models.identity import Node
-        from verdandi_codex.models.jacktrip import JackTripHub
-        
-        # First, check if there's a hub running
-        hub_node_ip = None
-        hub_hostname = None
-        hub_port = 4464
-        
-        try:
-            db = Database()
-            session = db.get_session()
-            hub_record = session.query(JackTripHub).first()
-            if hub_record and hub_record.hub_hostname:
-                hub_hostname = hub_record.hub_hostname
-                hub_port = hub_record.hub_port or 4464
-                # Look up the node to get its IP
-                hub_node = session.query(Node).filter_by(hostname=hub_hostname).first()
-                if hub_node:
-                    hub_node_ip = hub_node.ip_last_seen
-            session.close()
-        except Exception as e:
-            logger.error(f"Failed to check for running hub: {e}")
+        # First, check if there's a hub running. The database lookup happens on
+        # a worker thread; the dialog is shown once it completes.
+        self.connect_client_btn.setEnabled(False)
+        worker = _HubLookupWorker()
+        worker.signals.finished.connect(self._on_hub_lookup_finished)
+        QThreadPool.globalInstance().start(worker)
+    
+    def _on_hub_lookup_finished(self, hub_info: tuple):
+        """Continue _on_connect_client with the hub found in the database."""
+        hub_hostname, hub_node_ip, hub_port = hub_info
+        # Re-enable the button (it was clicked, so it was enabled); a successful
+        # connect disables it again below
+        self.connect_client_btn.setEnabled(True)
         
         if not hub_hostname or not hub_node_ip:
             QMessageBox.warning(self, "No Hub Running", 
@@ -1719,27 +2229,24 @@ class JackCanvasWithControls(QWidget):
         try:
             if self.is_remote:
                 # Start client on remote node via gRPC
-                from verdandi_hall.grpc_client import VerdandiGrpcClient
-                with VerdandiGrpcClient(self.remote_node, timeout=30) as client:
-                    response = client.start_jacktrip_client(
-                        hub_address=hub_node_ip,
-                        hub_port=hub_port,
-                        send_channels=send_channels,
-                        receive_channels=receive_channels,
-                        sample_rate=48000,
-                        buffer_size=256
-                    )
-                    
-                    # Check if the response indicates success
-                    if not response.success:
-                        raise Exception(f"JackTrip client failed to start: {response.message}")
-                    
-                    logger.info(f"JackTrip client started on {self.remote_node.hostname}: {response.message}")
+                client = get_shared_client(self.remote_node, timeout=30)
+                response = client.start_jacktrip_client(
+                    hub_address=hub_node_ip,
+                    hub_port=hub_port,
+                    send_channels=send_channels,
+                    receive_channels=receive_channels,
+                    sample_rate=48000,
+                    buffer_size=256
+                )
+                
+                # Check if the response indicates success
+                if not response.success:
+                    raise Exception(f"JackTrip client failed to start: {response.message}")
+                
+                logger.info(f"JackTrip client started on {self.remote_node.hostname}: {response.message}")
                 location = f"on {self.remote_node.hostname}"
             else:
                 # Start client locally via subprocess
-                import subprocess
-                
                 cmd = [
                     "jacktrip", "-C", hub_hostname  # Use hostname not IP
                 ]
@@ -1754,23 +2261,12 @@ class JackCanvasWithControls(QWidget):
                 if receive_channels != 2:
                     cmd.extend(["-o", str(receive_channels)])
                 try:
-                    # Start process in background, detached from terminal
+                    # Start process in background, detached from terminal;
+                    # longer wait to see if it connects
                     logger.info(f"Starting JackTrip client: {' '.join(cmd)}")
-                    proc = subprocess.Popen(
-                        cmd,
-                        stdout=subprocess.DEVNULL,
-                        stderr=subprocess.PIPE,
-                        start_new_session=True
+                    self._client_proc = self._launch_local_jacktrip(
+                        cmd, "client", timeout=2, start_new_session=True
                     )
-                    # Give it a moment to fail if there's an immediate error
-                    import time
-                    time.sleep(2)  # Longer wait to see if it connects
-                    poll = proc.poll()
-                    if poll is not None:
-                        # Process died, get error
-                        _, stderr = proc.communicate()
-                        error_msg = stderr.decode().strip() if stderr else "Unknown error"
-                        raise Exception(f"JackTrip client died (exit {poll}): {error_msg}")
                     location = "locally"
                 except Exception as e:
                     raise Exception(f"Failed to start local client: {e}")
@@ -1791,17 +2287,13 @@ class JackCanvasWithControls(QWidget):
                 QMessageBox.information(self, "Client Connected", 
                                       f"JackTrip client {location} connected to {hub_hostname}:{hub_port}.")
             
-            # Refresh canvas after a moment to show new JACK client
-            from PySide6.QtCore import QTimer
+            # Refresh canvas after a moment to show new JACK client (a remote
+            # canvas's refresh_from_jack requests a remote refresh)
+            self._schedule_refresh(2000)
             if self.is_remote:
-                # For remote canvas, trigger remote refresh
-                QTimer.singleShot(2000, lambda: self.canvas.remote_refresh_requested.emit())
                 # Also try to refresh the hub's canvas if we can access it
                 if self.parent() and hasattr(self.parent(), 'jack_canvas_widget'):
-                    QTimer.singleShot(2000, self.parent().jack_canvas_widget.canvas.refresh_from_jack)
-            else:
-                # For local canvas, just refresh locally
-                QTimer.singleShot(2000, self.canvas.refresh_from_jack)
+                    self.parent().jack_canvas_widget._schedule_refresh(2000)
             
             # Sync button states from database
             self._sync_state_from_database()
@@ -1813,17 +2305,10 @@ class JackCanvasWithControls(QWidget):
     def _on_disconnect_client(self):
         """Disconnect client from hub."""
         try:
-            if self.is_remote:
-                # Stop client on remote node via gRPC
-                from verdandi_hall.grpc_client import VerdandiGrpcClient
-                with VerdandiGrpcClient(self.remote_node, timeout=30) as client:
-                    response = client.stop_jacktrip_client()
-                location = f"on {self.remote_node.hostname}"
-            else:
-                # Stop client locally
-                import subprocess
-                subprocess.run(["pkill", "-f", "jacktrip.*-C"], check=False)
-                location = "locally"
+            location = self._stop_jacktrip(
+                lambda client: client.stop_jacktrip_client(), self._client_proc, "jacktrip.*-C"
+            )
+            self._client_proc = None
             
             self.client_connected = False
             self.hub_host = None
@@ -1835,8 +2320,7 @@ class JackCanvasWithControls(QWidget):
                                   f"JackTrip client {location} disconnected.")
             
             # Refresh canvas
-            from PySide6.QtCore import QTimer
-            QTimer.singleShot(1000, self.canvas.refresh_from_jack)
+            self._schedule_refresh()
             
             # Sync button states from database
             self._sync_state_from_database()
@@ -1845,6 +2329,68 @@ class JackCanvasWithControls(QWidget):
             logger.error(f"Failed to disconnect client: {e}", exc_info=True)
             QMessageBox.critical(self, "Error", f"Failed to disconnect client: {e}")
     
+    def _launch_local_jacktrip(self, cmd: List[str], what: str, timeout: float, **popen_kwargs):
+        """Start a local jacktrip process and give it timeout seconds to fail.
+        
+        Returns the running Popen, or raises with the start of its stderr if it
+        exited within the timeout.
+        """
+        # stdout is unused; stderr is only read (as text) if the launch fails
+        proc = subprocess.Popen(
+            cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, **popen_kwargs
+        )
+        # wait() returns as soon as it exits instead of always sleeping
+        try:
+            returncode = proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            return proc  # Still running - started fine
+        error_msg = self._launch_error(proc) or "Unknown error"
+        raise Exception(f"JackTrip {what} exited (code {returncode}): {error_msg}")
+    
+    def _stop_jacktrip(self, remote_stop, proc, pkill_pattern: str) -> str:
+        """Stop a JackTrip hub/client on the remote node or locally; returns where."""
+        if self.is_remote:
+            # Stop on remote node via gRPC
+            remote_stop(get_shared_client(self.remote_node, timeout=30))
+            return f"on {self.remote_node.hostname}"
+        self._stop_local_jacktrip(proc, pkill_pattern)
+        return "locally"
+    
+    @staticmethod
+    def _local_port_in_use(port: int) -> bool:
+        """True if something on this host is already listening on TCP port."""
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.settimeout(0.05)
+            return sock.connect_ex(("127.0.0.1", port)) == 0
+    
+    @staticmethod
+    def _launch_error(proc, limit: int = 4096) -> str:
+        """First limit characters of an exited process's stderr."""
+        if not proc.stderr:
+            return ""
+        try:
+            return proc.stderr.read(limit).strip()
+        finally:
+            proc.stderr.close()
+    
+    def _stop_local_jacktrip(self, proc, pkill_pattern: str):
+        """Stop a local JackTrip process.
+        
+        A process started from this panel is signalled directly; pkill is only
+        used for one we didn't launch (e.g. started before this GUI was opened).
+        """
+        if proc is None:
+            subprocess.run(["pkill", "-f", pkill_pattern], check=False)
+            return
+        if proc.poll() is not None:
+            return  # Already exited
+        proc.terminate()
+        try:
+            proc.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+    
     def _on_restart_daemon(self):
         """Restart the Verdandi daemon on the associated host."""
         if self.is_remote:
@@ -1870,7 +2416,6 @@ class JackCanvasWithControls(QWidget):
         try:
             if self.is_remote:
                 # Restart daemon on remote node via systemctl over SSH
-                import subprocess
                 ssh_cmd = [
                     "ssh", f"sysadmin@{self.remote_node.ip_last_seen}",
                     "sudo", "systemctl", "restart", "verdandi-daemon"
@@ -1882,8 +2427,7 @@ class JackCanvasWithControls(QWidget):
                                           f"Daemon restart initiated on {hostname}.\n\n"
                                           f"Services will be temporarily unavailable.")
                     # Wait a moment then refresh
-                    from PySide6.QtCore import QTimer
-                    QTimer.singleShot(3000, self.canvas.remote_refresh_requested.emit)
+                    self._schedule_refresh(3000)
                 else:
                     # Check if it's a sudo password issue
                     if "sudo" in result.stderr.lower() or "password" in result.stderr.lower():
@@ -1899,8 +2443,6 @@ class JackCanvasWithControls(QWidget):
                         raise Exception(f"SSH command failed: {result.stderr}")
             else:
                 # Restart local daemon
-                import subprocess
-                
                 # First check if the systemd service exists
                 check_result = subprocess.run(
                     ["systemctl", "list-units", "--all", "--type=service", "--no-pager"],
@@ -1931,7 +2473,6 @@ class JackCanvasWithControls(QWidget):
                                           "Local daemon restart initiated.\n\n"
                                           "This GUI will close. Please restart it after the daemon comes back up.")
                     # Close the GUI
-                    import sys
                     sys.exit(0)
                 else:
                     # Check if it's a sudo password issue
@@ -4,7 +4,8 @@ Wraps the jack library for canvas use.
 """
 
 import logging
-from typing import List, Dict, Optional, Set
+import threading
+from typing import List, Dict, Optional, Set, Tuple
 import jack
 
 logger = logging.getLogger(__name__)
@@ -15,14 +16,62 @@ class JackClientManager:
     
     def __init__(self, client_name: str = "verdandi_hall"):
         """Initialize JACK client connection."""
+        # Port list and connection map are cached until the JACK graph changes;
+        # caches are tagged with the graph version they were built from.
+        # The GUI thread, the preset connect worker and JACK's notification
+        # thread all touch this state, so reads/writes of the caches and the
+        # version bump happen under _cache_lock. JACK calls run outside it:
+        # libjack serialises requests itself, and a result built while the
+        # graph changed is simply not stored (its version is stale).
+        self._cache_lock = threading.Lock()
+        self._graph_version = 0
+        self._ports_cache = None  # (version, {(is_output, is_audio, is_midi): [names]})
+        self._conn_cache = None   # (version, {output: [inputs]})
+        self._snapshot_cache = None  # (version, snapshot() result)
+        self.shutdown = False  # Set once the JACK server has gone away
+        
         try:
             self.client = jack.Client(client_name)
+            # Callbacks must be registered before activation
+            self.client.set_port_registration_callback(self._on_graph_changed)
+            self.client.set_port_connect_callback(self._on_graph_changed)
+            self.client.set_samplerate_callback(self._on_samplerate_changed)
+            self.client.set_blocksize_callback(self._on_blocksize_changed)
+            self.client.set_shutdown_callback(self._on_shutdown)
+            # Only change via the callbacks above, so read them once here
+            self._sample_rate = self.client.samplerate
+            self._buffer_size = self.client.blocksize
             self.client.activate()
             logger.info(f"JACK client '{client_name}' activated")
         except jack.JackError as e:
             logger.error(f"Failed to create JACK client: {e}")
             raise
     
+    def _on_graph_changed(self, *args):
+        """JACK callback (notification thread): ports or connections changed."""
+        self.invalidate()
+    
+    def _on_samplerate_changed(self, samplerate: int):
+        """JACK callback: sample rate changed."""
+        self._sample_rate = samplerate
+    
+    def _on_blocksize_changed(self, blocksize: int):
+        """JACK callback: buffer size changed."""
+        self._buffer_size = blocksize
+    
+    def _on_shutdown(self, status, reason: str):
+        """JACK callback: the server shut down or dropped this client."""
+        self.shutdown = True
+        logger.error(f"JACK server shut down: {reason}")
+    
+    def invalidate(self):
+        """Drop cached ports and connections so the next query re-reads JACK."""
+        with self._cache_lock:
+            self._graph_version += 1
+            self._ports_cache = None
+            self._conn_cache = None
+            self._snapshot_cache = None
+    
     def get_ports(self, is_output: Optional[bool] = None, 
                   is_audio: bool = False, is_midi: bool = False) -> List[str]:
         """
@@ -37,28 +86,32 @@ class JackClientManager:
         Returns:
             List of port names (full names like "client:port")
         """
+        if self.shutdown:
+            return []
+        key = (is_output, is_audio, is_midi)
+        with self._cache_lock:
+            version = self._graph_version
+            cached = self._ports_cache
+            if cached is not None and cached[0] == version:
+                names = cached[1].get(key)
+                if names is not None:
+                    return list(names)
+        
         try:
-            # Get all ports first
-            all_ports = self.client.get_ports()
-            
-            # Filter based on criteria
-            result = []
-            for port in all_ports:
-                # Check output/input
-                if is_output is True and not port.is_output:
-                    continue
-                if is_output is False and not port.is_input:
-                    continue
-                
-                # Check audio/MIDI
-                if is_audio and not port.is_audio:
-                    continue
-                if is_midi and not port.is_midi:
-                    continue
-                
-                result.append(port.name)
-            
-            return result
+            # Let libjack do the filtering rather than checking each port here
+            ports = self.client.get_ports(
+                is_input=is_output is False,
+                is_output=is_output is True,
+                is_audio=is_audio,
+                is_midi=is_midi,
+            )
+            names = [port.name for port in ports]
+            with self._cache_lock:
+                if self._graph_version == version:
+                    if self._ports_cache is None or self._ports_cache[0] != version:
+                        self._ports_cache = (version, {})
+                    self._ports_cache[1][key] = names
+            return list(names)
         except Exception as e:
             logger.error(f"Error getting ports: {e}")
             return []
@@ -70,45 +123,99 @@ class JackClientManager:
         Returns:
             Dict mapping output port name to list of connected input port names.
             Example: {"system:capture_1": ["client:input_1", "client:input_2"]}
+            The dict is shared with later calls until the graph changes, so
+            callers must not modify it.
         """
+        if self.shutdown:
+            return {}
+        with self._cache_lock:
+            version = self._graph_version
+            cached = self._conn_cache
+            if cached is not None and cached[0] == version:
+                return cached[1]
+        
         connections = {}
         
         try:
-            # Get all ports
-            all_ports = self.client.get_ports()
+            # One pass over the output ports. jack.Port has no cached
+            # connection list for foreign ports, but get_all_connections reads
+            # libjack's client-side graph copy rather than asking the server.
+            get_connections = self.client.get_all_connections
+            for port in self.client.get_ports(is_output=True):
+                try:
+                    connected = get_connections(port)
+                except jack.JackError:
+                    # Port went away between listing and querying
+                    continue
+                if connected:
+                    connections[port.name] = [p.name for p in connected]
             
-            # For each output port, get its connections
-            for port in all_ports:
-                if port.is_output:
-                    # Get what this output is connected to
-                    try:
-                        connected = self.client.get_all_connections(port)
-                        if connected:
-                            connections[port.name] = [p.name for p in connected]
-                    except:
-                        # Port might not have connections
-                        pass
-        
+            with self._cache_lock:
+                if self._graph_version == version:
+                    self._conn_cache = (version, connections)
         except Exception as e:
             logger.error(f"Error getting connections: {e}")
         
         return connections
     
-    def get_sample_rate(self) -> int:
-        """Get current JACK sample rate."""
+    def snapshot(self) -> Tuple[List[str], Set[str], Set[str], Dict[str, List[str]]]:
+        """
+        Read ports and connections in one pass over the JACK port list.
+        
+        Returns:
+            (all port names, output port names, MIDI port names, connections)
+            where connections is as returned by get_all_connections. The
+            result is shared with later calls until the graph changes, so
+            callers must not modify it.
+        """
+        if self.shutdown:
+            return [], set(), set(), {}
+        with self._cache_lock:
+            version = self._graph_version
+            cached = self._snapshot_cache
+            if cached is not None and cached[0] == version:
+                return cached[1]
+        
+        names: List[str] = []
+        outputs: Set[str] = set()
+        midi: Set[str] = set()
+        connections: Dict[str, List[str]] = {}
         try:
-            return self.client.samplerate
+            get_connections = self.client.get_all_connections
+            for port in self.client.get_ports():
+                name = port.name
+                names.append(name)
+                if port.is_midi:
+                    midi.add(name)
+                if not port.is_output:
+                    continue
+                outputs.add(name)
+                try:
+                    connected = get_connections(port)
+                except jack.JackError:
+                    # Port went away between listing and querying
+                    continue
+                if connected:
+                    connections[name] = [p.name for p in connected]
         except Exception as e:
-            logger.error(f"Error getting sample rate: {e}")
-            return 48000  # Default fallback
+            logger.error(f"Error reading JACK graph: {e}")
+            return names, outputs, midi, connections
+        
+        result = (names, outputs, midi, connections)
+        with self._cache_lock:
+            if self._graph_version == version:
+                self._snapshot_cache = (version, result)
+                # The connection map is complete too, so get_all_connections can share it
+                self._conn_cache = (version, connections)
+        return result
+    
+    def get_sample_rate(self) -> int:
+        """Get current JACK sample rate."""
+        return self._sample_rate
     
     def get_buffer_size(self) -> int:
         """Get current JACK buffer size."""
-        try:
-            return self.client.blocksize
-        except Exception as e:
-            logger.error(f"Error getting buffer size: {e}")
-            return 256  # Default fallback
+        return self._buffer_size
     
     def connect_ports(self, output_port: str, input_port: str):
         """
@@ -120,6 +227,8 @@ class JackClientManager:
         """
         try:
             self.client.connect(output_port, input_port)
+            # Don't wait for the asynchronous connect callback to drop the cache
+            self.invalidate()
             logger.info(f"Connected {output_port} -> {input_port}")
         except jack.JackError as e:
             # Only log as error if it's not "already exists"
@@ -139,11 +248,41 @@ class JackClientManager:
         """
         try:
             self.client.disconnect(output_port, input_port)
+            self.invalidate()
             logger.info(f"Disconnected {output_port} -X- {input_port}")
         except jack.JackError as e:
             logger.error(f"Failed to disconnect {output_port} -X- {input_port}: {e}")
             raise
     
+    def connect_many(self, pairs: List[Tuple[str, str]]) -> List[Tuple[str, str, jack.JackError]]:
+        """
+        Connect many (output, input) port pairs with a single summary log line.
+        
+        Args:
+            pairs: (output_port, input_port) full names
+        
+        Returns:
+            (output_port, input_port, error) for each pair that failed.
+            Pairs that were already connected count as successes.
+        """
+        failed = []
+        connect = self.client.connect
+        for output_port, input_port in pairs:
+            try:
+                connect(output_port, input_port)
+            except jack.JackError as e:
+                if "already exists" in str(e).lower() or "(17)" in str(e):
+                    continue
+                failed.append((output_port, input_port, e))
+        self.invalidate()
+        
+        if failed:
+            logger.warning("Connected %d of %d port pairs; %d failed",
+                           len(pairs) - len(failed), len(pairs), len(failed))
+        else:
+            logger.info("Connected %d port pairs", len(pairs))
+        return failed
+    
     def close(self):
         """Close the JACK client connection."""
         try:
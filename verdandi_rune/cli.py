@@ -1,77 +1,124 @@
+# PYTHON_ARGCOMPLETE_OK
 """
 Verdandi Rune - CLI entry point.
 """
 
+import os
 import sys
 import argparse
-import structlog
+from functools import lru_cache
 
-from verdandi_codex.config import VerdandiConfig
-from verdandi_codex.database import Database
+# Node status -> marker shown in the nodes listing (anything else is "○")
+_STATUS_SYMBOLS = {"online": "●"}
 
 
-logger = structlog.get_logger()
+@lru_cache(maxsize=1)
+def _get_config():
+    """Load the node configuration once per process."""
+    from verdandi_codex.config import VerdandiConfig
+    
+    return VerdandiConfig.load()
+
+
+@lru_cache(maxsize=1)
+def _get_db():
+    """Create the database connection pool once per process."""
+    from verdandi_codex.database import Database
+    
+    # The CLI runs one query at a time, so keep the pool small
+    return Database(_get_config().database, pool_size=4, max_overflow=0)
+
+
+def _configure_logger():
+    """Configure structlog and return a logger.
+    
+    Only called on the error path, so successful commands never import
+    structlog or its console renderer.
+    """
+    import structlog
+    
+    structlog.configure(
+        processors=[
+            structlog.processors.add_log_level,
+            structlog.processors.TimeStamper(fmt="iso"),
+            structlog.dev.ConsoleRenderer(),
+        ]
+    )
+    return structlog.get_logger()
+
+
+def _write_lines(lines):
+    """Write a block of output lines to stdout in one call."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 
 def cmd_status(args):
     """Show node status."""
-    config = VerdandiConfig.load()
-    
-    print("Verdandi Node Status")
-    print("=" * 50)
-    print(f"Node ID:         {config.node.node_id}")
-    print(f"Hostname:        {config.node.hostname}")
-    print(f"Display Name:    {config.node.display_name or '(not set)'}")
-    print(f"Personality:     {config.node.personality_name or '(not set)'}")
-    print(f"\nDaemon:")
-    print(f"  Host:          {config.daemon.grpc_host}")
-    print(f"  Port:          {config.daemon.grpc_port}")
-    print(f"  mDNS:          {'enabled' if config.daemon.enable_mdns else 'disabled'}")
-    print(f"\nDatabase:")
-    print(f"  Host:          {config.database.host}")
-    print(f"  Port:          {config.database.port}")
-    print(f"  Database:      {config.database.database}")
+    config = _get_config()
+    
+    lines = [
+        "Verdandi Node Status",
+        "=" * 50,
+        f"Node ID:         {config.node.node_id}",
+        f"Hostname:        {config.node.hostname}",
+        f"Display Name:    {config.node.display_name or '(not set)'}",
+        f"Personality:     {config.node.personality_name or '(not set)'}",
+        "\nDaemon:",
+        f"  Host:          {config.daemon.grpc_host}",
+        f"  Port:          {config.daemon.grpc_port}",
+        f"  mDNS:          {'enabled' if config.daemon.enable_mdns else 'disabled'}",
+        "\nDatabase:",
+        f"  Host:          {config.database.host}",
+        f"  Port:          {config.database.port}",
+        f"  Database:      {config.database.database}",
+    ]
     
     # Test database connection
     try:
-        db = Database(config.database)
-        print(f"  Status:        ✓ Connected")
+        db = _get_db()
+        lines.append("  Status:        ✓ Connected")
     except Exception as e:
-        print(f"  Status:        ✗ Error: {e}")
+        lines.append(f"  Status:        ✗ Error: {e}")
+    
+    _write_lines(lines)
 
 
 def cmd_init_db(args):
     """Initialize database schema."""
-    from verdandi_codex.db_init import init_database
+    from verdandi_codex.db_init import confirm_drop, init_database
     
-    if args.drop:
-        confirm = input("⚠️  This will DROP ALL TABLES. Are you sure? (yes/no): ")
-        if confirm.lower() != "yes":
-            print("Aborted.")
-            return
+    if args.drop and not confirm_drop():
+        return
     
     init_database(drop_existing=args.drop)
 
 
 def cmd_config(args):
     """Show or edit configuration."""
-    config = VerdandiConfig.load()
+    from verdandi_codex.config import VerdandiConfig, YamlDumper
+    
+    config = _get_config()
     
     if args.edit:
         config_file = VerdandiConfig.get_config_file()
-        import os
-        editor = os.getenv("EDITOR", "nano")
-        os.system(f"{editor} {config_file}")
+        import shlex
+        # Hand the process over to the editor; nothing runs after it exits
+        editor = shlex.split(os.getenv("EDITOR") or "nano") or ["nano"]
+        os.execvp(editor[0], editor + [str(config_file)])
+    elif args.format == "json":
+        import json
+        print(json.dumps(config.to_dict(), indent=2))
     else:
         import yaml
-        print(yaml.dump(config.to_dict(), default_flow_style=False, sort_keys=False))
+        print(yaml.dump(config.to_dict(), Dumper=YamlDumper, default_flow_style=False, sort_keys=False))
 
 
 def cmd_certs(args):
     """Manage certificates."""
     from verdandi_codex.crypto import NodeCertificateManager
     
-    config = VerdandiConfig.load()
+    config = _get_config()
     cert_manager = NodeCertificateManager()
     
     if args.init:
@@ -80,105 +127,91 @@ def cmd_certs(args):
             config.node.node_id,
             config.node.hostname,
         )
-        if created:
-            print("✓ Certificates created successfully")
-        else:
-            print("✓ Certificates already exist")
-        
         paths = cert_manager.get_certificate_paths()
-        print(f"\nCA Certificate:   {paths['ca_cert']}")
-        print(f"Node Certificate: {paths['node_cert']}")
-        print(f"Node Key:         {paths['node_key']}")
+        _write_lines([
+            "✓ Certificates created successfully" if created else "✓ Certificates already exist",
+            f"\nCA Certificate:   {paths['ca_cert']}",
+            f"Node Certificate: {paths['node_cert']}",
+            f"Node Key:         {paths['node_key']}",
+        ])
     
     elif args.show:
         paths = cert_manager.get_certificate_paths()
         fingerprint = cert_manager.get_certificate_fingerprint()
         
-        print("Certificate Status")
-        print("=" * 50)
-        print(f"CA Certificate:   {paths['ca_cert']}")
-        print(f"Node Certificate: {paths['node_cert']}")
-        print(f"Node Key:         {paths['node_key']}")
-        print(f"\nFingerprint:      {fingerprint or '(not found)'}")
+        _write_lines([
+            "Certificate Status",
+            "=" * 50,
+            f"CA Certificate:   {paths['ca_cert']}",
+            f"Node Certificate: {paths['node_cert']}",
+            f"Node Key:         {paths['node_key']}",
+            f"\nFingerprint:      {fingerprint or '(not found)'}",
+        ])
 
 
 def cmd_nodes(args):
     """List registered nodes."""
-    from verdandi_codex.database import Database
     from verdandi_codex.models import Node
     
-    config = VerdandiConfig.load()
-    
-    try:
-        db = Database(config.database)
-        session = db.get_session()
+    with _get_db().session_scope() as session:
+        query = session.query(Node)
+        if args.status:
+            query = query.filter(Node.status == args.status)
+        if args.hostname_prefix:
+            query = query.filter(Node.hostname.startswith(args.hostname_prefix, autoescape=True))
         
-        nodes = session.query(Node).order_by(Node.hostname).all()
+        # Stream rows in hostname-index order instead of materialising the
+        # whole table, writing each batch to stdout in one call
+        lines = ["Registered Nodes", "=" * 80]
+        node_count = 0
+        for node_count, node in enumerate(query.order_by(Node.hostname.asc()).yield_per(200), 1):
+            status_symbol = _STATUS_SYMBOLS.get(node.status, "○")
+            lines.append(
+                f"\n{status_symbol} {node.hostname} ({node.display_name})\n"
+                f"  Node ID:  {node.node_id}\n"
+                f"  Address:  {node.ip_last_seen}:{node.daemon_port}\n"
+                f"  Status:   {node.status}\n"
+                f"  Last Seen: {node.last_seen_at}"
+            )
+            if node_count % 200 == 0:
+                _write_lines(lines)
+                lines = []
         
-        if not nodes:
-            print("No nodes registered yet.")
-            print("\nHint: Start verdandi-engine to discover nodes via mDNS")
+        if not node_count:
+            if args.status or args.hostname_prefix:
+                print("No nodes match the given filters.")
+            else:
+                print("No nodes registered yet.")
+                print("\nHint: Start verdandi-engine to discover nodes via mDNS")
             return
         
-        print(f"Registered Nodes ({len(nodes)})")
-        print("=" * 80)
-        
-        for node in nodes:
-            status_symbol = "●" if node.status == "online" else "○"
-            print(f"\n{status_symbol} {node.hostname} ({node.display_name})")
-            print(f"  Node ID:  {node.node_id}")
-            print(f"  Address:  {node.ip_last_seen}:{node.daemon_port}")
-            print(f"  Status:   {node.status}")
-            print(f"  Last Seen: {node.last_seen_at}")
-        
-        session.close()
-        
-    except Exception as e:
-        print(f"Error: {e}")
+        lines.append(f"\n{node_count} node(s) listed")
+        _write_lines(lines)
 
 
 def cmd_jacktrip(args):
     """Manage JackTrip hub state."""
-    config = VerdandiConfig.load()
-    db = Database(config.database)
-    
     if args.clear_hub:
         from verdandi_codex.models.jacktrip import JackTripHub
         
-        session = db.get_session()
-        hub = session.query(JackTripHub).first()
-        
-        if hub:
-            print(f"Clearing hub state: {hub.hub_hostname} (port {hub.hub_port})")
-            session.delete(hub)
-            session.commit()
-            print("✓ Hub state cleared from database")
-        else:
-            print("No hub state in database")
-        
-        session.close()
+        with _get_db().session_scope() as session:
+            hub = session.query(JackTripHub).first()
+            
+            if hub:
+                print(f"Clearing hub state: {hub.hub_hostname} (port {hub.hub_port})")
+                session.delete(hub)
+                session.commit()
+                print("✓ Hub state cleared from database")
+            else:
+                print("No hub state in database")
 
 
-def main():
-    """Main CLI entry point."""
-    structlog.configure(
-        processors=[
-            structlog.processors.add_log_level,
-            structlog.processors.TimeStamper(fmt="iso"),
-            structlog.dev.ConsoleRenderer(),
-        ]
-    )
-    
-    parser = argparse.ArgumentParser(
-        description="Verdandi Rune - CLI for Verdandi operations"
-    )
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
-    
-    # Status command
+def _build_status_parser(subparsers):
     parser_status = subparsers.add_parser("status", help="Show node status")
     parser_status.set_defaults(func=cmd_status)
-    
-    # Init-db command
+
+
+def _build_init_db_parser(subparsers):
     parser_init_db = subparsers.add_parser("init-db", help="Initialize database schema")
     parser_init_db.add_argument(
         "--drop",
@@ -186,17 +219,25 @@ def main():
         help="Drop existing tables (DESTRUCTIVE)",
     )
     parser_init_db.set_defaults(func=cmd_init_db)
-    
-    # Config command
+
+
+def _build_config_parser(subparsers):
     parser_config = subparsers.add_parser("config", help="Show or edit configuration")
     parser_config.add_argument(
         "--edit",
         action="store_true",
         help="Edit configuration file in $EDITOR",
     )
+    parser_config.add_argument(
+        "--format",
+        choices=["yaml", "json"],
+        default="yaml",
+        help="Output format when showing configuration",
+    )
     parser_config.set_defaults(func=cmd_config)
-    
-    # Certs command
+
+
+def _build_certs_parser(subparsers):
     parser_certs = subparsers.add_parser("certs", help="Manage certificates")
     parser_certs.add_argument(
         "--init",
@@ -209,12 +250,23 @@ def main():
         help="Show certificate information",
     )
     parser_certs.set_defaults(func=cmd_certs)
-    
-    # Nodes command
+
+
+def _build_nodes_parser(subparsers):
     parser_nodes = subparsers.add_parser("nodes", help="List registered nodes")
+    parser_nodes.add_argument(
+        "--status",
+        choices=["online", "offline", "degraded"],
+        help="Only list nodes with this status",
+    )
+    parser_nodes.add_argument(
+        "--hostname-prefix",
+        help="Only list nodes whose hostname starts with this prefix",
+    )
     parser_nodes.set_defaults(func=cmd_nodes)
-    
-    # JackTrip command
+
+
+def _build_jacktrip_parser(subparsers):
     parser_jacktrip = subparsers.add_parser("jacktrip", help="Manage JackTrip hub state")
     parser_jacktrip.add_argument(
         "--clear-hub",
@@ -222,6 +274,44 @@ def main():
         help="Clear stale hub state from database",
     )
     parser_jacktrip.set_defaults(func=cmd_jacktrip)
+
+
+# Subcommand name -> function that registers its parser
+COMMANDS = {
+    "status": _build_status_parser,
+    "init-db": _build_init_db_parser,
+    "config": _build_config_parser,
+    "certs": _build_certs_parser,
+    "nodes": _build_nodes_parser,
+    "jacktrip": _build_jacktrip_parser,
+}
+
+
+def main():
+    """Main CLI entry point."""
+    parser = argparse.ArgumentParser(
+        description="Verdandi Rune - CLI for Verdandi operations"
+    )
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+    
+    # Only build the subparser that will run; --help and unknown
+    # commands still get the full tree
+    command = sys.argv[1] if len(sys.argv) > 1 else None
+    if command in COMMANDS:
+        COMMANDS[command](subparsers)
+    else:
+        for build in COMMANDS.values():
+            build(subparsers)
+    
+    # Shell completion is optional; argcomplete exits here when completing,
+    # before any handler (and its database/config imports) can run
+    if "_ARGCOMPLETE" in os.environ:
+        try:
+            import argcomplete
+        except ImportError:
+            pass
+        else:
+            argcomplete.autocomplete(parser)
     
     args = parser.parse_args()
     
@@ -233,6 +323,7 @@ def main():
         args.func(args)
         return 0
     except Exception as e:
+        logger = _configure_logger()
         logger.error("command_failed", command=args.command, error=str(e), exc_info=True)
         return 1
 